@@ -33,6 +33,7 @@ class EDRPlugin:
         QgsApplication.instance().dataItemProviderRegistry().addProvider(self.saved_queries_provider)
         self.downloader_pool = QThreadPool()
         self.downloader_pool.setMaxThreadCount(self.MAX_SIMULTANEOUS_DOWNLOADS)
+        self.fetcher_pool = QThreadPool()
         self.main_dialog = None
         self.layer_manager = EdrLayerManager(self)
         self.communication = UICommunication(self.iface, self.PLUGIN_NAME)
@@ -1,9 +1,18 @@
 import json
+import threading
+import time
+from collections import OrderedDict
 
 from PyQt5.QtNetwork import QNetworkRequest
 from qgis.core import QgsBlockingNetworkRequest
 from qgis.PyQt.QtCore import QUrl, QUrlQuery
 
+METADATA_CACHE = OrderedDict()  # (URL, authentication config ID) to (fetch time, parsed content), oldest used first
+METADATA_CACHE_LOCK = threading.Lock()
+METADATA_CACHE_TTL = 60.0  # Seconds
+METADATA_CACHE_MAX_ENTRIES = 128
+METADATA_CACHE_MAX_CONTENT_SIZE = 1024 * 1024  # Bytes - larger responses (e.g. big feature listings) are not cached
+
 
 class EdrApiClientError(Exception):
     """EDR API exception class."""
@@ -19,6 +28,10 @@ class EdrApiClient:
         self.authentication_config_id = authentication_config_id
         self.use_post_request = use_post_request
 
+    def snapshot(self):
+        """Return independent copy of the client - safe to be handed over to the background workers."""
+        return EdrApiClient(self.root, self.authentication_config_id, self.use_post_request)
+
     def get_request(self, url, **params):
         request_url = QUrl(url)
         blocking_network_request = QgsBlockingNetworkRequest()
@@ -45,6 +58,33 @@ class EdrApiClient:
         reply = network_request.reply()
         return reply
 
+    def get_cached_metadata(self, url):
+        cache_key = (url, self.authentication_config_id)
+        now = time.monotonic()
+        with METADATA_CACHE_LOCK:
+            cache_entry = METADATA_CACHE.get(cache_key)
+            if cache_entry is not None:
+                fetch_time, response_json = cache_entry
+                if now - fetch_time < METADATA_CACHE_TTL:
+                    METADATA_CACHE.move_to_end(cache_key)
+                    return response_json
+                del METADATA_CACHE[cache_key]
+        response = self.get_request_reply(url)
+        raw_content = response.content().data()
+        response_json = json.loads(raw_content.decode(errors="ignore"))
+        if len(raw_content) <= METADATA_CACHE_MAX_CONTENT_SIZE:
+            with METADATA_CACHE_LOCK:
+                METADATA_CACHE[cache_key] = (now, response_json)
+                METADATA_CACHE.move_to_end(cache_key)
+                while len(METADATA_CACHE) > METADATA_CACHE_MAX_ENTRIES:
+                    METADATA_CACHE.popitem(last=False)
+        return response_json
+
+    @staticmethod
+    def clear_metadata_cache():
+        with METADATA_CACHE_LOCK:
+            METADATA_CACHE.clear()
+
     @property
     def landing_page_path(self):
         url = f"{self.root}/"
@@ -102,9 +142,7 @@ class EdrApiClient:
         return url
 
     def get_collections(self):
-        response = self.get_request_reply(self.collections_path)
-        raw_content = response.content().data().decode(errors="ignore")
-        response_json = json.loads(raw_content)
+        response_json = self.get_cached_metadata(self.collections_path)
         collections = response_json.get("collections", [])
         return collections
 
@@ -115,23 +153,17 @@ class EdrApiClient:
         return collection
 
     def get_collection_instances(self, collection_id):
-        response = self.get_request_reply(self.collection_instances_path(collection_id))
-        raw_content = response.content().data().decode(errors="ignore")
-        response_json = json.loads(raw_content)
+        response_json = self.get_cached_metadata(self.collection_instances_path(collection_id))
         collection_instances = response_json.get("instances", [])
         return collection_instances
 
     def get_collection_items(self, collection_id, instance_id=None):
-        response = self.get_request_reply(self.collection_items_path(collection_id, instance_id))
-        raw_content = response.content().data().decode(errors="ignore")
-        response_json = json.loads(raw_content)
+        response_json = self.get_cached_metadata(self.collection_items_path(collection_id, instance_id))
         collection_items = response_json.get("features", [])
         return collection_items
 
     def get_collection_locations(self, collection_id, instance_id=None):
-        response = self.get_request_reply(self.collection_locations_path(collection_id, instance_id))
-        raw_content = response.content().data().decode(errors="ignore")
-        response_json = json.loads(raw_content)
+        response_json = self.get_cached_metadata(self.collection_locations_path(collection_id, instance_id))
         collection_locations = response_json.get("features", [])
         return collection_locations
 
@@ -162,10 +162,20 @@ class RasterTemplate:
         no_data_value: float = -9999999,
     ) -> None:
         """Write given numpy array to given band. No data value is set to -9999999 by default."""
+        if np_array.size == 0:
+            raise ValueError("No resulting data in the Query.")
+
         band: gdal.Band = dp.GetRasterBand(band_number)
         band.SetNoDataValue(no_data_value)
 
-        np_array[np_array == None] = no_data_value
+        if np_array.dtype == object:
+            no_data_mask = np_array == None
+            if no_data_mask.all():
+                # nothing to write, band is filled with no data value only
+                band.Fill(no_data_value)
+                band = None
+                return
+            np_array[no_data_mask] = no_data_value
 
         np_array = np.flip(np_array, 0)
 
@@ -1,15 +1,16 @@
-import json
 import os
+import re
 from datetime import datetime
 from functools import partial
+from types import MappingProxyType
 
-from qgis.core import QgsCoordinateReferenceSystem, QgsGeometry, QgsSettings
+from qgis.core import QgsCoordinateReferenceSystem
 from qgis.gui import QgsCollapsibleGroupBox
 from qgis.PyQt import uic
-from qgis.PyQt.QtCore import QDateTime, Qt
+from qgis.PyQt.QtCore import Qt
 from qgis.PyQt.QtWidgets import QCheckBox, QComboBox, QDateTimeEdit, QDialog, QFileDialog, QInputDialog, QLineEdit
 
-from edr_plugin.api_client import EdrApiClient, EdrApiClientError
+from edr_plugin.api_client import EdrApiClient
 from edr_plugin.gui.query_tools import (
     AreaQueryBuilderTool,
     CorridorQueryBuilderTool,
@@ -31,27 +32,87 @@ from edr_plugin.queries import (
     TrajectoryQueryDefinition,
 )
 from edr_plugin.queries.enumerators import EdrDataQuery
-from edr_plugin.threading import EdrDataDownloader
-from edr_plugin.utils import EdrSettingsPath, is_dir_writable, reproject_geometry
+from edr_plugin.threading import (
+    EdrCollectionInstancesFetcher,
+    EdrCollectionMetadataFetcher,
+    EdrCollectionsFetcher,
+    EdrDataDownloader,
+)
+from edr_plugin.utils import (
+    EdrSettingsPath,
+    SettingsCache,
+    add_combobox_items,
+    crs_from_definition,
+    is_dir_writable,
+    ogc_crs_wkt,
+    qdatetime_from_iso,
+    reproject_geometry,
+)
+
+DATA_QUERY_DEFINITIONS = MappingProxyType(
+    {
+        EdrDataQuery.AREA.value: AreaQueryDefinition,
+        EdrDataQuery.CUBE.value: CubeQueryDefinition,
+        EdrDataQuery.POSITION.value: PositionQueryDefinition,
+        EdrDataQuery.RADIUS.value: RadiusQueryDefinition,
+        EdrDataQuery.ITEMS.value: ItemsQueryDefinition,
+        EdrDataQuery.LOCATIONS.value: LocationsQueryDefinition,
+        EdrDataQuery.TRAJECTORY.value: TrajectoryQueryDefinition,
+        EdrDataQuery.CORRIDOR.value: CorridorQueryDefinition,
+    }
+)
+
+DATA_QUERY_TOOLS = MappingProxyType(
+    {
+        EdrDataQuery.AREA.value: AreaQueryBuilderTool,
+        EdrDataQuery.CUBE.value: CubeQueryBuilderTool,
+        EdrDataQuery.POSITION.value: PositionQueryBuilderTool,
+        EdrDataQuery.RADIUS.value: RadiusQueryBuilderTool,
+        EdrDataQuery.ITEMS.value: ItemsQueryBuilderTool,
+        EdrDataQuery.LOCATIONS.value: LocationsQueryBuilderTool,
+        EdrDataQuery.TRAJECTORY.value: TrajectoryQueryBuilderTool,
+        EdrDataQuery.CORRIDOR.value: CorridorQueryBuilderTool,
+    }
+)
+
+WKT_GEOMETRY_PATTERN = re.compile(
+    r"^(?:MULTI)?(?:POINT|LINESTRING|POLYGON)\s*(?:ZM|Z|M)?\s*(?:\(|EMPTY)|^GEOMETRYCOLLECTION\b"
+)
+
+CLEAR_WIDGET_ACTIONS = MappingProxyType(
+    {
+        QgsCollapsibleGroupBox: lambda widget: widget.setDisabled(True),
+        QCheckBox: lambda widget: widget.setChecked(False),
+        QComboBox: lambda widget: widget.clear(),
+        QDateTimeEdit: lambda widget: widget.clear(),
+        QLineEdit: lambda widget: widget.clear(),
+    }
+)
+
+CLEAR_WIDGET_ACTIONS_CACHE = {}  # Widget class to the clear action resolved through the class MRO
 
+UI_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "ui")
+EDR_FORM_CLASS, _ = uic.loadUiType(os.path.join(UI_DIR, "edr.ui"))
+REPEAT_QUERY_FORM_CLASS, _ = uic.loadUiType(os.path.join(UI_DIR, "repeat_query.ui"))
 
-class EdrDialog(QDialog):
+
+class EdrDialog(QDialog, EDR_FORM_CLASS):
     """Main EDR plugin dialog."""
 
     def __init__(self, plugin, parent=None):
         QDialog.__init__(self, parent)
-        ui_filepath = os.path.join(os.path.dirname(os.path.realpath(__file__)), "ui", "edr.ui")
-        self.ui = uic.loadUi(ui_filepath, self)
+        self.setupUi(self)
         self.plugin = plugin
-        self.settings = QgsSettings()
+        self._setup_widget_levels()
         server_urls = self.read_server_urls()
+        self.known_server_urls = dict.fromkeys(server_urls)  # Dictionary used as an ordered set
         self.server_url_cbo.addItems(server_urls)
-        last_used_server_url = self.settings.value(EdrSettingsPath.LAST_SERVER_URL.value)
+        last_used_server_url = SettingsCache.get(EdrSettingsPath.LAST_SERVER_URL)
         if last_used_server_url:
             self.server_url_cbo.setCurrentText(last_used_server_url)
-        edr_authcfg = self.settings.value(EdrSettingsPath.LAST_AUTHCFG.value, "", type=str)
+        edr_authcfg = SettingsCache.get(EdrSettingsPath.LAST_AUTHCFG, "", str)
         self.server_auth_config.setConfigId(edr_authcfg)
-        download_dir = self.settings.value(EdrSettingsPath.DOWNLOAD_DIR.value, "", type=str)
+        download_dir = SettingsCache.get(EdrSettingsPath.DOWNLOAD_DIR, "", str)
         self.download_dir_le.setText(download_dir)
         self.api_client = EdrApiClient(
             self.server_url_cbo.currentText(),
@@ -59,6 +120,10 @@ class EdrDialog(QDialog):
             use_post_request=self.post_cbox.isChecked(),
         )
         self.current_data_query_tool = None
+        self.collections_request_id = 0
+        self.collections_fetch_key = None
+        self.instances_request_id = 0
+        self.collections_populated = False
         self.server_url_cbo.currentTextChanged.connect(self.set_edr_server_url)
         self.add_server_pb.clicked.connect(self.add_edr_server_url)
         self.remove_server_pb.clicked.connect(self.remove_edr_server_url)
@@ -77,32 +142,32 @@ class EdrDialog(QDialog):
         self.run_and_save_pb.clicked.connect(partial(self.query_data_collection, True))
         self.run_pb.clicked.connect(self.query_data_collection)
         self.run_pb.setFocus()
-        if server_urls:
+
+    def showEvent(self, event):
+        """Populate collections on the first show, so the dialog is painted before any request is made."""
+        super().showEvent(event)
+        if not self.collections_populated and self.server_url_cbo.count():
             self.populate_collections()
-            self.populate_collection_data()
 
     def read_server_urls(self):
         """Read server urls from QGIS settings."""
-        server_urls = self.settings.value(EdrSettingsPath.SAVED_SERVERS.value, [])
+        server_urls = SettingsCache.get(EdrSettingsPath.SAVED_SERVERS, [])
         return server_urls
 
     def save_server_urls(self):
         """Save server urls into QGIS settings."""
-        server_urls = [self.server_url_cbo.itemText(i) for i in range(self.server_url_cbo.count())]
-        self.settings.setValue(EdrSettingsPath.SAVED_SERVERS.value, server_urls)
+        server_urls = list(self.known_server_urls)
+        SettingsCache.set(EdrSettingsPath.SAVED_SERVERS, server_urls)
 
     def set_edr_server_url(self):
         """Set EDR server URL."""
         current_server_url = self.server_url_cbo.currentText()
-        authcfg = self.server_auth_config.configId()
-        self.api_client = EdrApiClient(
-            current_server_url,
-            authentication_config_id=authcfg,
-            use_post_request=self.post_cbox.isChecked(),
-        )
-        self.settings.setValue(EdrSettingsPath.LAST_SERVER_URL.value, current_server_url)
+        if current_server_url == self.api_client.root:
+            return
+        self.api_client.root = current_server_url
+        self.api_client.authentication_config_id = self.server_auth_config.configId()
+        SettingsCache.set(EdrSettingsPath.LAST_SERVER_URL, current_server_url)
         self.populate_collections()
-        self.populate_collection_data()
 
     def add_edr_server_url(self):
         """Add EDR server URL."""
@@ -110,8 +175,9 @@ class EdrDialog(QDialog):
         if accept is False:
             return
         server_url = server_url.strip("/")
-        if self.server_url_cbo.findText(server_url) > -1:
+        if server_url in self.known_server_urls:
             return
+        self.known_server_urls[server_url] = None
         self.server_url_cbo.addItem(server_url)
         self.server_url_cbo.setCurrentText(server_url)
         self.set_edr_server_url()
@@ -119,20 +185,17 @@ class EdrDialog(QDialog):
 
     def remove_edr_server_url(self):
         """Remove EDR server URL."""
+        self.known_server_urls.pop(self.server_url_cbo.currentText(), None)
         self.server_url_cbo.removeItem(self.server_url_cbo.currentIndex())
         self.save_server_urls()
 
     def on_edr_credentials_changed(self, edr_authcfg):
         """Update EDR server credential settings."""
-        server_url = self.server_url_cbo.currentText()
-        self.settings.setValue(EdrSettingsPath.LAST_AUTHCFG.value, edr_authcfg)
-        self.api_client = EdrApiClient(
-            server_url,
-            authentication_config_id=edr_authcfg,
-            use_post_request=self.post_cbox.isChecked(),
-        )
+        if edr_authcfg == self.api_client.authentication_config_id:
+            return
+        SettingsCache.set(EdrSettingsPath.LAST_AUTHCFG, edr_authcfg)
+        self.api_client.authentication_config_id = edr_authcfg
         self.populate_collections()
-        self.populate_collection_data()
 
     def set_download_directory(self):
         """Set download directory."""
@@ -142,7 +205,7 @@ class EdrDialog(QDialog):
         if not download_dir:
             return
         if is_dir_writable(download_dir):
-            self.settings.setValue(EdrSettingsPath.DOWNLOAD_DIR.value, download_dir)
+            SettingsCache.set(EdrSettingsPath.DOWNLOAD_DIR, download_dir)
             self.download_dir_le.setText(download_dir)
         else:
             self.plugin.communication.bar_warn("Can't write to the selected location. Please pick another folder.")
@@ -176,49 +239,16 @@ class EdrDialog(QDialog):
     @property
     def data_query_definitions(self):
         """Return query definition class associated with type of the query."""
-        query_definitions_map = {
-            EdrDataQuery.AREA.value: AreaQueryDefinition,
-            EdrDataQuery.CUBE.value: CubeQueryDefinition,
-            EdrDataQuery.POSITION.value: PositionQueryDefinition,
-            EdrDataQuery.RADIUS.value: RadiusQueryDefinition,
-            EdrDataQuery.ITEMS.value: ItemsQueryDefinition,
-            EdrDataQuery.LOCATIONS.value: LocationsQueryDefinition,
-            EdrDataQuery.TRAJECTORY.value: TrajectoryQueryDefinition,
-            EdrDataQuery.CORRIDOR.value: CorridorQueryDefinition,
-        }
-        return query_definitions_map
+        return DATA_QUERY_DEFINITIONS
 
     @property
     def data_query_tools(self):
         """Return query builder tool associated with type of the query."""
-        query_tools_map = {
-            EdrDataQuery.AREA.value: AreaQueryBuilderTool,
-            EdrDataQuery.CUBE.value: CubeQueryBuilderTool,
-            EdrDataQuery.POSITION.value: PositionQueryBuilderTool,
-            EdrDataQuery.RADIUS.value: RadiusQueryBuilderTool,
-            EdrDataQuery.ITEMS.value: ItemsQueryBuilderTool,
-            EdrDataQuery.LOCATIONS.value: LocationsQueryBuilderTool,
-            EdrDataQuery.TRAJECTORY.value: TrajectoryQueryBuilderTool,
-            EdrDataQuery.CORRIDOR.value: CorridorQueryBuilderTool,
-        }
-        return query_tools_map
+        return DATA_QUERY_TOOLS
 
-    @property
-    def collection_level_widgets(self):
-        """Collection level widgets."""
-        widgets = [self.instance_cbo] + self.instance_level_widgets
-        return widgets
-
-    @property
-    def instance_level_widgets(self):
-        """Instance level widgets."""
-        widgets = [self.query_cbo] + self.query_level_widgets
-        return widgets
-
-    @property
-    def query_level_widgets(self):
-        """Query level widgets."""
-        widgets = [
+    def _setup_widget_levels(self):
+        """Group widgets by the level of the data they are depending on."""
+        self._query_level_widgets = (
             self.query_extent_le,
             self.crs_cbo,
             self.format_cbo,
@@ -234,110 +264,197 @@ class EdrDialog(QDialog):
             self.use_vertical_range_cbox,
             self.custom_dimension_cbo,
             self.custom_intervals_cbo,
-            self.use_vertical_range_cbox,
-            self.toggle_vertical_intervals_cbox,
-        ]
-        return widgets
+        )
+        self._instance_level_widgets = (self.query_cbo,) + self._query_level_widgets
+        self._collection_level_widgets = (self.instance_cbo,) + self._instance_level_widgets
+
+    @property
+    def collection_level_widgets(self):
+        """Collection level widgets."""
+        return self._collection_level_widgets
+
+    @property
+    def instance_level_widgets(self):
+        """Instance level widgets."""
+        return self._instance_level_widgets
+
+    @property
+    def query_level_widgets(self):
+        """Query level widgets."""
+        return self._query_level_widgets
 
     @staticmethod
     def clear_widgets(*widgets):
-        """Clear widgets."""
+        """Clear widgets. Signals are blocked as dependent widgets are always cleared within the same call."""
         for widget in widgets:
-            if isinstance(widget, QgsCollapsibleGroupBox):
-                widget.setDisabled(True)
-            elif isinstance(widget, QCheckBox):
-                widget.setChecked(False)
-            elif isinstance(widget, (QComboBox, QDateTimeEdit, QLineEdit)):
-                widget.clear()
-            else:
-                pass
+            widget_cls = type(widget)
+            try:
+                clear_action = CLEAR_WIDGET_ACTIONS_CACHE[widget_cls]
+            except KeyError:
+                clear_action = None
+                for cls in widget_cls.__mro__:
+                    if cls in CLEAR_WIDGET_ACTIONS:
+                        clear_action = CLEAR_WIDGET_ACTIONS[cls]
+                        break
+                CLEAR_WIDGET_ACTIONS_CACHE[widget_cls] = clear_action
+            if clear_action is not None:
+                signals_blocked = widget.blockSignals(True)
+                try:
+                    clear_action(widget)
+                finally:
+                    widget.blockSignals(signals_blocked)
 
     def populate_collections(self):
-        """Populate available collections."""
+        """Request available collections - combobox is populated when the response arrives."""
         self.clear_widgets(self.collection_cbo, *self.collection_level_widgets)
+        self.instances_request_id += 1
+        self.collections_populated = True
+        self.collection_cbo.setDisabled(True)
+        api_client = self.api_client
+        collections_fetch_key = (api_client.root, api_client.authentication_config_id, api_client.use_post_request)
+        if collections_fetch_key == self.collections_fetch_key:
+            return  # The same request is already in flight - its response will populate the collections
+        self.collections_fetch_key = collections_fetch_key
+        self.collections_request_id += 1
+        fetcher_api_client = api_client.snapshot()  # Snapshot unaffected by later dialog changes
+        collections_fetcher = EdrCollectionsFetcher(fetcher_api_client, self.collections_request_id)
+        collections_fetcher.signals.fetch_success.connect(self.on_collections_fetched)
+        collections_fetcher.signals.fetch_failure.connect(self.on_collections_fetch_failed)
+        self.plugin.fetcher_pool.start(collections_fetcher)
+
+    def on_collections_fetched(self, request_id, collections):
+        """Populate available collections. Responses of the outdated requests are skipped."""
+        if request_id != self.collections_request_id:
+            return
+        self.collections_fetch_key = None
+        self.collection_cbo.setEnabled(True)
         try:
-            for collection in self.api_client.get_collections():
+            collections_with_names = []
+            for collection in collections:
                 collection_id = collection["id"]
                 collection_name = collection.get("title", collection_id)
                 if not collection_name:
                     collection_name = collection_id
-                self.collection_cbo.addItem(collection_name, collection)
+                collections_with_names.append((collection_name, collection))
+            add_combobox_items(self.collection_cbo, collections_with_names)
         except Exception as e:
             self.plugin.communication.show_error(f"Fetching collections failed due to the following error:\n{e}")
+            return
+        self.populate_collection_data()
 
-    def _crs_from_combobox(self) -> QgsCoordinateReferenceSystem:
+    def on_collections_fetch_failed(self, request_id, error_message):
+        """Feedback on fetching collections failure. Errors of the outdated requests are skipped."""
+        if request_id != self.collections_request_id:
+            return
+        self.collections_fetch_key = None
+        self.collection_cbo.setEnabled(True)
+        self.plugin.communication.show_error(
+            f"Fetching collections failed due to the following error:\n{error_message}"
+        )
+
+    def set_query_extent_text(self, query_extent_text):
+        """Set query extent text scrolled to its beginning, with the line edit signals blocked."""
+        signals_blocked = self.query_extent_le.blockSignals(True)
+        self.query_extent_le.setText(query_extent_text)
+        self.query_extent_le.setCursorPosition(0)
+        self.query_extent_le.blockSignals(signals_blocked)
+
+    def current_output_crs(self) -> QgsCoordinateReferenceSystem:
+        """Return output CRS selected in the CRS combobox."""
         crs_name, crs_wkt = self.crs_cbo.currentText(), self.crs_cbo.currentData()
-        if crs_wkt:
-            crs = QgsCoordinateReferenceSystem.fromWkt(crs_wkt)
-        else:
-            crs = QgsCoordinateReferenceSystem.fromOgcWmsCrs(crs_name)
+        crs = crs_from_definition(crs_name, crs_wkt)
         return crs
 
+    def _crs_id_from_combobox(self) -> str:
+        crs = self.current_output_crs()
+        crs_id = crs.authid() or crs.toWkt()
+        return crs_id
+
     def populate_collection_data(self):
         """Populate collection data."""
-        previous_geom = None
-        previous_query_type = None
-        previous_crs = None
-        previous_query_data_tool = self.current_data_query_tool
-        if self.query_extent_le.text():
-            previous_geom = QgsGeometry.fromWkt(self.query_extent_le.text())
-            previous_query_type = self.query_cbo.currentText()
-            previous_crs = self._crs_from_combobox()
+        previous_wkt = self.query_extent_le.text().strip().upper()
+        previous_query = None
+        if WKT_GEOMETRY_PATTERN.match(previous_wkt):  # Items/locations IDs and cube bbox are not restored
+            previous_query = (
+                previous_wkt,
+                self.query_cbo.currentText(),
+                self._crs_id_from_combobox(),
+                self.current_data_query_tool,
+            )
 
         try:
             self.clear_widgets(*self.collection_level_widgets)
+            self.instances_request_id += 1
             collection = self.collection_cbo.currentData()
             if not collection:
                 return
             try:
-                instance_link = False
                 data_queries = collection["data_queries"]
                 # Add for legacy implementations
                 c_links = collection["links"]
-                for c_link in c_links:
-                    if "/instances" in c_link["href"].lower():
-                        instance_link = True
+                instance_link = any("/instances" in c_link["href"].lower() for c_link in c_links)
             except KeyError:
                 return
             if ("instances" in data_queries) or instance_link:
                 self.instance_cbo.setEnabled(True)
-                self.populate_instances()
+                self.populate_instances(previous_query)
             else:
                 self.instance_cbo.setDisabled(True)
                 self.populate_data_queries()
-
-            if previous_geom:
-                for i in range(self.query_cbo.count()):
-                    query_type = self.query_cbo.itemText(i)
-                    if query_type == previous_query_type:
-                        self.query_cbo.setCurrentIndex(i)
-                        current_crs = self._crs_from_combobox()
-                        if previous_crs == current_crs:
-                            self.current_data_query_tool = previous_query_data_tool
-                            self.query_extent_le.setText(previous_geom.asWkt().upper())
-                            self.query_extent_le.setCursorPosition(0)
-                            break
-
+                self.restore_previous_query(previous_query)
         except Exception as e:
             self.plugin.communication.show_error(f"Populating collection data failed due to the following error:\n{e}")
 
-    def populate_instances(self):
-        """Populate instances."""
+    def restore_previous_query(self, previous_query):
+        """Restore previous query type and extent if they are still applicable."""
+        if not previous_query:
+            return
+        previous_wkt, previous_query_type, previous_crs_id, previous_query_data_tool = previous_query
+        query_type_at = self.query_cbo.itemText
+        for i in range(self.query_cbo.count()):
+            query_type = query_type_at(i)
+            if query_type == previous_query_type:
+                self.query_cbo.setCurrentIndex(i)
+                if previous_crs_id == self._crs_id_from_combobox():
+                    self.current_data_query_tool = previous_query_data_tool
+                    self.set_query_extent_text(previous_wkt)
+                    break
+
+    def populate_instances(self, previous_query=None):
+        """Request collection instances - combobox is populated when the response arrives."""
+        self.clear_widgets(*self.collection_level_widgets)
+        self.instances_request_id += 1
+        self.instance_cbo.setEnabled(True)
+        collection = self.collection_cbo.currentData()
+        if not collection:
+            return
+        fetcher_api_client = self.api_client.snapshot()  # Snapshot unaffected by later dialog changes
+        instances_fetcher = EdrCollectionInstancesFetcher(
+            fetcher_api_client, collection["id"], self.instances_request_id
+        )
+        instances_fetcher.signals.fetch_success.connect(partial(self.on_instances_fetched, previous_query))
+        instances_fetcher.signals.fetch_failure.connect(self.on_instances_fetch_failed)
+        self.plugin.fetcher_pool.start(instances_fetcher)
+
+    def on_instances_fetched(self, previous_query, request_id, instances):
+        """Populate collection instances. Responses of the outdated requests are skipped."""
+        if request_id != self.instances_request_id:
+            return
         try:
-            self.clear_widgets(*self.collection_level_widgets)
-            self.instance_cbo.setEnabled(True)
-            collection = self.collection_cbo.currentData()
-            if not collection:
-                return
-            collection_id = collection["id"]
-            instances = self.api_client.get_collection_instances(collection_id)
-            for instance in instances:
-                instance_id = instance["id"]
-                self.instance_cbo.addItem(instance_id, instance)
+            add_combobox_items(self.instance_cbo, ((instance["id"], instance) for instance in instances))
             self.populate_data_queries()
+            self.restore_previous_query(previous_query)
         except Exception as e:
             self.plugin.communication.show_error(f"Populating instances failed due to the following error:\n{e}")
 
+    def on_instances_fetch_failed(self, request_id, error_message):
+        """Feedback on fetching instances failure. Errors of the outdated requests are skipped."""
+        if request_id != self.instances_request_id:
+            return
+        self.plugin.communication.show_error(
+            f"Populating instances failed due to the following error:\n{error_message}"
+        )
+
     def populate_data_queries(self):
         """Populate collection data queries."""
         try:
@@ -352,10 +469,13 @@ class EdrDialog(QDialog):
                 data_queries = collection["data_queries"]
             except KeyError:
                 return
-            for query_name, data_query in data_queries.items():
-                if query_name not in self.data_query_tools:
-                    continue
-                self.query_cbo.addItem(query_name, data_query)
+            data_query_tools = self.data_query_tools
+            supported_data_queries = [
+                (query_name, data_query)
+                for query_name, data_query in data_queries.items()
+                if query_name in data_query_tools
+            ]
+            add_combobox_items(self.query_cbo, supported_data_queries)
             self.populate_data_query_attributes()
         except Exception as e:
             self.plugin.communication.show_error(f"Populating data queries failed due to the following error:\n{e}")
@@ -373,11 +493,11 @@ class EdrDialog(QDialog):
                         if value.startswith("R"):
                             try:
                                 num_of_intervals, min_value, interval_step = [int(v) for v in value[1:].split("/")]
-                                custom_values = [str(v) for v in range(min_value, num_of_intervals + 1, interval_step)]
+                                custom_values = map(str, range(min_value, num_of_intervals + 1, interval_step))
                             except ValueError:
                                 custom_values = [value]
                         elif "," in value:
-                            custom_values = [v for v in value.split(",")]
+                            custom_values = value.split(",")
                         else:
                             custom_values = [value]
                     else:
@@ -405,11 +525,7 @@ class EdrDialog(QDialog):
             data_query = self.query_cbo.currentData()
             if not data_query:
                 return
-            crs_data = []
-            for crs_name in collection.get("crs", []):
-                crs = QgsCoordinateReferenceSystem.fromOgcWmsCrs(crs_name)
-                crs_wkt = crs.toWkt()
-                crs_data.append((crs_name, crs_wkt))
+            crs_data = [(crs_name, ogc_crs_wkt(crs_name)) for crs_name in collection.get("crs", [])]
             output_formats = collection.get("output_formats", [])
             default_output_format = ""
             data_link = data_query["link"]
@@ -424,19 +540,16 @@ class EdrDialog(QDialog):
                     crs_data.append((crs_name, crs_wkt))
                 output_formats = data_query_variables.get("output_formats", output_formats)
                 default_output_format = data_query_variables.get("default_output_format", default_output_format)
-            for crs_name, crs_wkt in crs_data:
-                self.crs_cbo.addItem(crs_name, crs_wkt)
+            add_combobox_items(self.crs_cbo, crs_data)
             self.format_cbo.addItems(output_formats)
             self.format_cbo.setCurrentText(default_output_format)
             parameter_names = collection["parameter_names"]
-            for parameter, parameter_data in parameter_names.items():
-                if "label" in parameter_data:
-                    observed_property_label = parameter_data["label"]
-                else:
-                    observed_property = parameter_data["observedProperty"]
-                    observed_property_label = observed_property["label"]
-                parameter_description = parameter_data.get("description", observed_property_label)
-                self.parameters_cbo.addItem(parameter_description, parameter)
+            parameter_description = self.parameter_description
+            parameters_with_descriptions = [
+                (parameter_description(parameter_data), parameter)
+                for parameter, parameter_data in parameter_names.items()
+            ]
+            add_combobox_items(self.parameters_cbo, parameters_with_descriptions)
             self.parameters_cbo.toggleItemCheckState(0)
             collection_extent = collection["extent"]
             try:
@@ -444,8 +557,8 @@ class EdrDialog(QDialog):
                 temporal_extent = collection_extent["temporal"]
                 temporal_interval = temporal_extent["interval"]
                 from_datetime_str, to_datetime_str = temporal_interval[0]
-                from_datetime = QDateTime.fromString(from_datetime_str, Qt.ISODate)
-                to_datetime = QDateTime.fromString(to_datetime_str, Qt.ISODate)
+                from_datetime = qdatetime_from_iso(from_datetime_str)
+                to_datetime = qdatetime_from_iso(to_datetime_str)
                 self.from_datetime.setTimeSpec(Qt.UTC)
                 self.to_datetime.setTimeSpec(Qt.UTC)
                 self.from_datetime.setDateTime(from_datetime)
@@ -463,9 +576,10 @@ class EdrDialog(QDialog):
             try:
                 self.custom_grp.setEnabled(True)
                 custom_dimensions = collection_extent["custom"]
-                for custom_dimension in custom_dimensions:
-                    custom_dimension_name = custom_dimension["id"]
-                    self.custom_dimension_cbo.addItem(custom_dimension_name, custom_dimension)
+                add_combobox_items(
+                    self.custom_dimension_cbo,
+                    ((custom_dimension["id"], custom_dimension) for custom_dimension in custom_dimensions),
+                )
                 self.custom_dimension_cbo.setCurrentIndex(0)
                 self.populate_custom_dimension_values()
             except KeyError:
@@ -475,6 +589,18 @@ class EdrDialog(QDialog):
                 f"Populating data query attributes failed due to the following error:\n{e}"
             )
 
+    @staticmethod
+    def parameter_description(parameter_data):
+        """Return parameter description, falling back to the parameter or observed property label."""
+        try:
+            return parameter_data["description"]
+        except KeyError:
+            pass
+        try:
+            return parameter_data["label"]
+        except KeyError:
+            return parameter_data["observedProperty"]["label"]
+
     def collect_query_parameters(self):
         """Collect query parameters from the widgets."""
         collection = self.collection_cbo.currentData()
@@ -526,8 +652,7 @@ class EdrDialog(QDialog):
 
     def query_data_collection(self, save_query=False):
         """Define data query and get the data collection."""
-        collection = self.collection_cbo.currentData()
-        if not collection:
+        if self.collection_cbo.currentIndex() < 0:
             self.plugin.communication.show_warn(f"There is no any collection selected. Action aborted.")
             self.raise_()
             return
@@ -564,35 +689,32 @@ class EdrDialog(QDialog):
         download_worker.signals.download_success.connect(self.on_success_signal)
         download_worker.signals.download_failure.connect(self.on_failure_signal)
         if save_query:
-            saved_queries = json.loads(self.settings.value(EdrSettingsPath.SAVED_QUERIES.value, "{}"))
+            saved_queries = SettingsCache.saved_queries()
             data_query_request_parameters = data_query_definition.as_request_parameters()
-            timestamp = datetime.now().isoformat().split(".")[0]
-            saved_query_id = f"{data_query_definition.collection_id} [{timestamp}]"
-            if server_url not in saved_queries:
-                saved_queries[server_url] = {}
+            collection_id = data_query_definition.collection_id
+            timestamp = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+            saved_query_id = f"{collection_id} [{timestamp}]"
             saved_query_value = {
                 "query": data_query_request_parameters,
                 "authcfg": edr_authcfg,
                 "download_dir": download_dir,
             }
-            try:
-                saved_queries[server_url][saved_query_id] = saved_query_value
-            except KeyError:
-                saved_queries[server_url] = {saved_query_id: saved_query_value}
-            self.settings.setValue(EdrSettingsPath.SAVED_QUERIES.value, json.dumps(saved_queries))
+            saved_queries.setdefault(server_url, {})[saved_query_id] = saved_query_value
+            SettingsCache.save_saved_queries(saved_queries)
             self.plugin.saved_queries_provider.root_item.refresh_server_items()
         self.plugin.downloader_pool.start(download_worker)
         self.close()
 
     def read_saved_query(self, server_url, saved_query_id):
         """Read saved query data definition with server URL and authorization config ID."""
-        saved_queries = json.loads(self.settings.value(EdrSettingsPath.SAVED_QUERIES.value, "{}"))
+        saved_queries = SettingsCache.saved_queries()
         saved_query_value = saved_queries[server_url][saved_query_id]
         data_query_request_parameters = saved_query_value["query"]
         collection_id, sub_endpoint_queries, query_parameters = data_query_request_parameters
         data_query_definition_cls = self.data_query_definitions[sub_endpoint_queries["query"]]
+        # Request parameters are consumed while building the definition, so pass copies of the cached values
         data_query_definition = data_query_definition_cls.from_request_parameters(
-            collection_id, sub_endpoint_queries, query_parameters
+            collection_id, dict(sub_endpoint_queries), dict(query_parameters)
         )
         edr_authcfg = saved_query_value["authcfg"]
         download_dir = saved_query_value["download_dir"]
@@ -606,23 +728,20 @@ class EdrDialog(QDialog):
             authentication_config_id=edr_authcfg,
             use_post_request=self.post_cbox.isChecked(),
         )
-        try:
-            collection = worker_api_client.get_collection(data_query_definition.collection_id)
-        except EdrApiClientError as e:
-            self.plugin.communication.show_error(f"Fetching collection failed due to the following error:\n{e}")
-            return
-        try:
-            instances = worker_api_client.get_collection_instances(data_query_definition.collection_id)
-        except EdrApiClientError:
-            instances = []
+        metadata_fetcher = EdrCollectionMetadataFetcher(worker_api_client, data_query_definition.collection_id)
+        metadata_fetcher.signals.fetch_success.connect(
+            partial(self.on_saved_query_metadata_fetched, worker_api_client, data_query_definition, download_dir)
+        )
+        metadata_fetcher.signals.fetch_failure.connect(self.on_fetch_failure_signal)
+        self.plugin.fetcher_pool.start(metadata_fetcher)
+
+    def on_saved_query_metadata_fetched(
+        self, worker_api_client, data_query_definition, download_dir, collection, instances
+    ):
+        """Confirm saved query variables and start downloading the data."""
         repeat_dialog = RepeatQueryDialog(data_query_definition, collection, instances, parent=self)
         if repeat_dialog.instance_grp.isEnabled() or repeat_dialog.temporal_grp.isEnabled():
             repeat_dialog.exec_()
-        worker_api_client = EdrApiClient(
-            server_url,
-            authentication_config_id=edr_authcfg,
-            use_post_request=self.post_cbox.isChecked(),
-        )
         download_worker = EdrDataDownloader(worker_api_client, data_query_definition, download_dir)
         download_worker.signals.download_progress.connect(self.on_progress_signal)
         download_worker.signals.download_success.connect(self.on_success_signal)
@@ -637,21 +756,24 @@ class EdrDialog(QDialog):
         """Feedback on getting data success signal."""
         self.plugin.communication.clear_message_bar()
         self.plugin.communication.bar_info(message)
-        self.plugin.layer_manager.add_layer_from_file(download_filepath)
+        self.plugin.layer_manager.add_layer_from_file_in_background(download_filepath)
 
     def on_failure_signal(self, error_message, download_filepath):
         """Feedback on getting data failure signal."""
         self.plugin.communication.clear_message_bar()
         self.plugin.communication.bar_error(error_message)
 
+    def on_fetch_failure_signal(self, error_message):
+        """Feedback on fetching metadata failure signal."""
+        self.plugin.communication.show_error(error_message)
+
 
-class RepeatQueryDialog(QDialog):
+class RepeatQueryDialog(QDialog, REPEAT_QUERY_FORM_CLASS):
     """Repeat saved query dialog."""
 
     def __init__(self, data_query_definition, collection, instances=None, parent=None):
         QDialog.__init__(self, parent)
-        ui_filepath = os.path.join(os.path.dirname(os.path.realpath(__file__)), "ui", "repeat_query.ui")
-        self.ui = uic.loadUi(ui_filepath, self)
+        self.setupUi(self)
         self.data_query_definition = data_query_definition
         self.collection = collection
         self.instances = instances or []
@@ -664,8 +786,7 @@ class RepeatQueryDialog(QDialog):
     def populate_instances(self):
         """Populate instances if available."""
         if self.instances:
-            for instance in self.instances:
-                self.instance_cbo.addItem(instance["id"], instance)
+            add_combobox_items(self.instance_cbo, ((instance["id"], instance) for instance in self.instances))
         else:
             self.instance_grp.setDisabled(True)
 
@@ -678,8 +799,8 @@ class RepeatQueryDialog(QDialog):
             temporal_extent = collection_extent["temporal"]
             temporal_interval = temporal_extent["interval"]
             from_datetime_str, to_datetime_str = temporal_interval[0]
-            from_datetime = QDateTime.fromString(from_datetime_str, Qt.ISODate)
-            to_datetime = QDateTime.fromString(to_datetime_str, Qt.ISODate)
+            from_datetime = qdatetime_from_iso(from_datetime_str)
+            to_datetime = qdatetime_from_iso(to_datetime_str)
             self.from_datetime.setTimeSpec(Qt.UTC)
             self.to_datetime.setTimeSpec(Qt.UTC)
             self.from_datetime.setDateTime(from_datetime)
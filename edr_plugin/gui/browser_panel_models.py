@@ -1,11 +1,9 @@
-import json
-
 import sip
-from qgis.core import QgsDataCollectionItem, QgsDataItem, QgsDataItemProvider, QgsDataProvider, QgsSettings
-from qgis.PyQt.QtGui import QIcon
+from qgis.core import QgsDataCollectionItem, QgsDataItem, QgsDataItemProvider, QgsDataProvider
 from qgis.PyQt.QtWidgets import QAction, QInputDialog
 
-from edr_plugin.utils import EdrSettingsPath, icon_filepath
+from edr_plugin.api_client import EdrApiClient
+from edr_plugin.utils import EdrSettingsPath, SettingsCache, plugin_icon
 
 
 class EdrRootItem(QgsDataCollectionItem):
@@ -21,56 +19,53 @@ class EdrRootItem(QgsDataCollectionItem):
         provider_key = plugin.PLUGIN_ENTRY_NAME
         QgsDataCollectionItem.__init__(self, parent, name, provider_key)
         self.plugin = plugin
-        self.setIcon(QIcon(icon_filepath("edr.png")))
-        self.server_items = []
+        self.setIcon(plugin_icon("edr.png"))
 
     def createChildren(self):
-        del self.server_items[:]
-        settings = QgsSettings()
-        available_servers = settings.value(EdrSettingsPath.SAVED_SERVERS.value, [])
-        saved_queries = json.loads(settings.value(EdrSettingsPath.SAVED_QUERIES.value, "{}"))
+        available_servers = SettingsCache.get(EdrSettingsPath.SAVED_SERVERS, [])
+        saved_queries = SettingsCache.saved_queries(reload=True)
         items = []
         for server_url in available_servers:
             queries = saved_queries.get(server_url, {})
             if not queries:
                 continue
             server_item = EdrServerItem(self.plugin, server_url, self)
-            server_item.setState(QgsDataItem.Populated)
-            server_item.refresh()
-            sip.transferto(server_item, self)
             items.append(server_item)
-            self.server_items.append(server_item)
         return items
 
     def refresh_server_items(self):
-        self.depopulate()
-        self.createChildren()
+        if self.state() != QgsDataItem.Populated:
+            return  # Server items are created once the root item gets expanded
+        for server_item in self.children():
+            if server_item.state() == QgsDataItem.Populated:
+                server_item.refresh()
+        self.refresh()
 
     def reload_collections(self):
+        EdrApiClient.clear_metadata_cache()
         self.plugin.ensure_main_dialog_initialized()
         self.plugin.main_dialog.populate_collections()
         self.plugin.run()
 
     def actions(self, parent):
-        action_new_query = QAction(QIcon(icon_filepath("play.png")), "New query", parent)
+        action_new_query = QAction(plugin_icon("play.png"), "New query", parent)
         action_new_query.triggered.connect(self.plugin.run)
-        action_reload_collections = QAction(QIcon(icon_filepath("reload.png")), "Reload collections", parent)
+        action_reload_collections = QAction(plugin_icon("reload.png"), "Reload collections", parent)
         action_reload_collections.triggered.connect(self.reload_collections)
-        action_refresh = QAction(QIcon(icon_filepath("refresh.png")), "Refresh", parent)
+        action_refresh = QAction(plugin_icon("refresh.png"), "Refresh", parent)
         action_refresh.triggered.connect(self.refresh_server_items)
         actions = [action_new_query, action_reload_collections, action_refresh]
         return actions
 
 
-class EdrServerItem(EdrRootItem):
+class EdrServerItem(QgsDataCollectionItem):
     """EDR server data item. Contains saved queries."""
 
     def __init__(self, plugin, server_url, parent):
-        EdrRootItem.__init__(self, plugin, server_url, parent)
+        QgsDataCollectionItem.__init__(self, parent, server_url, f"{plugin.PLUGIN_ENTRY_NAME}/{server_url}")
         self.plugin = plugin
         self.server_url = server_url
-        self.setIcon(QIcon(icon_filepath("server.png")))
-        self.query_items = []
+        self.setIcon(plugin_icon("server.png"))
 
     def new_server_query(self):
         self.plugin.ensure_main_dialog_initialized()
@@ -82,31 +77,26 @@ class EdrServerItem(EdrRootItem):
             None, "Confirm deletion", "Are you sure you want to delete all saved queries for this server?"
         )
         if deletion_confirmed:
-            settings = QgsSettings()
-            saved_queries = json.loads(settings.value(EdrSettingsPath.SAVED_QUERIES.value, "{}"))
+            saved_queries = SettingsCache.saved_queries()
             queries = saved_queries.get(self.server_url, {})
             queries.clear()
-            settings.setValue(EdrSettingsPath.SAVED_QUERIES.value, json.dumps(saved_queries))
-            self.parent().refresh_server_items()
+            SettingsCache.save_saved_queries(saved_queries)
+            self.parent().deleteChildItem(self)
 
     def createChildren(self):
-        settings = QgsSettings()
-        saved_queries = json.loads(settings.value(EdrSettingsPath.SAVED_QUERIES.value, "{}"))
+        saved_queries = SettingsCache.saved_queries()
         queries = saved_queries.get(self.server_url, {})
         items = []
-        for query_name in queries.keys():
+        for query_name in queries:
             query_item = SavedQueryItem(self.plugin, self.server_url, query_name, self)
             query_item.setState(QgsDataItem.Populated)
-            query_item.refresh()
-            sip.transferto(query_item, self)
             items.append(query_item)
-            self.query_items.append(query_item)
         return items
 
     def actions(self, parent):
-        action_new_server_query = QAction(QIcon(icon_filepath("play_solid.png")), "New server query", parent)
+        action_new_server_query = QAction(plugin_icon("play_solid.png"), "New server query", parent)
         action_new_server_query.triggered.connect(self.new_server_query)
-        action_delete_server_queries = QAction(QIcon(icon_filepath("delete_all.png")), "Delete server queries", parent)
+        action_delete_server_queries = QAction(plugin_icon("delete_all.png"), "Delete server queries", parent)
         action_delete_server_queries.triggered.connect(self.delete_server_queries)
         actions = [action_new_server_query, action_delete_server_queries]
         return actions
@@ -120,15 +110,14 @@ class SavedQueryItem(QgsDataItem):
         self.server_url = server_url
         self.query_name = query_name
         QgsDataItem.__init__(self, QgsDataItem.Collection, parent, query_name, f"/{server_url}/{query_name}")
-        self.setIcon(QIcon(icon_filepath("request.png")))
+        self.setIcon(plugin_icon("request.png"))
 
     def repeat_query(self):
         self.plugin.ensure_main_dialog_initialized()
         self.plugin.main_dialog.repeat_saved_query_data_collection(self.server_url, self.query_name)
 
     def rename_query(self):
-        settings = QgsSettings()
-        saved_queries = json.loads(settings.value(EdrSettingsPath.SAVED_QUERIES.value, "{}"))
+        saved_queries = SettingsCache.saved_queries()
         new_name, accept = QInputDialog.getText(None, "Rename", "New name", text=self.name())
         if accept:
             server_saved_queries = saved_queries[self.server_url]
@@ -138,25 +127,25 @@ class SavedQueryItem(QgsDataItem):
             if new_name in server_saved_queries:
                 self.plugin.communication.show_warn("Query name already exists. Renaming canceled!")
                 return
+            server_saved_queries[new_name] = server_saved_queries.pop(self.query_name)
+            SettingsCache.save_saved_queries(saved_queries)
+            self.query_name = new_name
             self.setName(new_name)
-            server_saved_queries[new_name] = server_saved_queries[self.query_name]
-            del server_saved_queries[self.query_name]
-            settings.setValue(EdrSettingsPath.SAVED_QUERIES.value, json.dumps(saved_queries))
-            self.parent().refresh()
+            self.setPath(f"/{self.server_url}/{new_name}")
+            self.dataChanged.emit(self)
 
     def delete_query(self):
-        settings = QgsSettings()
-        saved_queries = json.loads(settings.value(EdrSettingsPath.SAVED_QUERIES.value, "{}"))
+        saved_queries = SettingsCache.saved_queries()
         del saved_queries[self.server_url][self.query_name]
-        settings.setValue(EdrSettingsPath.SAVED_QUERIES.value, json.dumps(saved_queries))
-        self.parent().refresh()
+        SettingsCache.save_saved_queries(saved_queries)
+        self.parent().deleteChildItem(self)
 
     def actions(self, parent):
-        action_repeat = QAction(QIcon(icon_filepath("replay.png")), "Repeat query", parent)
+        action_repeat = QAction(plugin_icon("replay.png"), "Repeat query", parent)
         action_repeat.triggered.connect(self.repeat_query)
-        action_rename = QAction(QIcon(icon_filepath("rename.png")), "Rename query", parent)
+        action_rename = QAction(plugin_icon("rename.png"), "Rename query", parent)
         action_rename.triggered.connect(self.rename_query)
-        action_delete = QAction(QIcon(icon_filepath("delete.png")), "Delete", parent)
+        action_delete = QAction(plugin_icon("delete.png"), "Delete", parent)
         action_delete.triggered.connect(self.delete_query)
         actions = [action_repeat, action_rename, action_delete]
         return actions
@@ -1,4 +1,3 @@
-from PyQt5.QtGui import QIcon
 from qgis.core import QgsApplication, QgsDataItem, QgsDataItemProvider, QgsDataProvider, QgsMimeDataUtils
 from qgis.gui import QgsCustomDropHandler
 from qgis.PyQt.QtCore import QCoreApplication, QDir, QFileInfo
@@ -6,14 +5,11 @@ from qgis.PyQt.QtWidgets import QAction
 
 COVERAGE_JSON_PROVIDERKEY = "coveragejson"
 
-COVERAGEJSON_EXTENSIONS = ["covjson", "coveragejson"]
+COVERAGEJSON_EXTENSIONS = ("covjson", "coveragejson")
 
 
 def is_path_coverage_json(path: str) -> bool:
-    for ext in COVERAGEJSON_EXTENSIONS:
-        if path.lower().endswith(ext):
-            return True
-    return False
+    return path.lower().endswith(COVERAGEJSON_EXTENSIONS)
 
 
 class CoverageJSONDropHandler(QgsCustomDropHandler):
@@ -71,6 +67,7 @@ class CoverageJSONItem(QgsDataItem):
         super().__init__(QgsDataItem.Custom, parent, name, path)
         self.setState(QgsDataItem.Populated)  # no children
         self.setToolTip(QDir.toNativeSeparators(path))
+        self.setIcon(QgsApplication.getThemeIcon("/mIconFile.svg"))
         self.layer_manager = layer_manager
 
     def hasDragEnabled(self):  # pylint: disable=missing-docstring
@@ -99,11 +96,7 @@ class CoverageJSONItem(QgsDataItem):
         return True
 
     def actions(self, parent):  # pylint: disable=missing-docstring
-        if is_path_coverage_json(self.path()):
-            action_text = QCoreApplication.translate("CoverageJSON", "&Open CoverageJSON…")
+        action_text = QCoreApplication.translate("CoverageJSON", "&Open CoverageJSON…")
         open_action = QAction(action_text, parent)
         open_action.triggered.connect(self.open_coveragejson)
         return [open_action]
-
-    def icon(self) -> QIcon:
-        return QIcon(QgsApplication.getThemeIcon("/mIconFile.svg"))
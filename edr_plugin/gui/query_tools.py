@@ -5,13 +5,11 @@ from abc import abstractmethod
 from qgis.core import (
     Qgis,
     QgsApplication,
-    QgsCoordinateReferenceSystem,
     QgsCoordinateTransform,
     QgsGeometry,
     QgsLayerTreeUtils,
     QgsPoint,
     QgsProject,
-    QgsSettings,
     QgsVectorLayer,
     QgsWkbTypes,
 )
@@ -38,7 +36,6 @@ from qgis.PyQt.QtWidgets import (
     QToolButton,
 )
 
-from edr_plugin.api_client import EdrApiClientError
 from edr_plugin.queries import (
     AreaQueryDefinition,
     CorridorQueryDefinition,
@@ -49,19 +46,36 @@ from edr_plugin.queries import (
     RadiusQueryDefinition,
     TrajectoryQueryDefinition,
 )
-from edr_plugin.utils import EdrSettingsPath, reproject_geometry, string_to_bool
+from edr_plugin.threading import EdrCollectionFeaturesFetcher
+from edr_plugin.utils import (
+    EdrSettingsPath,
+    SettingsCache,
+    add_combobox_items,
+    project_coordinate_transform,
+    reproject_geometry,
+    string_to_bool,
+)
+
+UI_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "ui")
+AREA_FORM_CLASS, _ = uic.loadUiType(os.path.join(UI_DIR, "query_area.ui"))
+CUBE_FORM_CLASS, _ = uic.loadUiType(os.path.join(UI_DIR, "query_cube.ui"))
+RADIUS_FORM_CLASS, _ = uic.loadUiType(os.path.join(UI_DIR, "query_radius.ui"))
+CORRIDOR_FORM_CLASS, _ = uic.loadUiType(os.path.join(UI_DIR, "query_corridor.ui"))
+TRAJECTORY_FORM_CLASS, _ = uic.loadUiType(os.path.join(UI_DIR, "query_trajectory.ui"))
+ITEMS_FORM_CLASS, _ = uic.loadUiType(os.path.join(UI_DIR, "query_items.ui"))
+LOCATIONS_FORM_CLASS, _ = uic.loadUiType(os.path.join(UI_DIR, "query_locations.ui"))
 
 
-class AreaQueryBuilderTool(QDialog):
+class AreaQueryBuilderTool(QDialog, AREA_FORM_CLASS):
     """Dialog for defining area data query."""
 
     def __init__(self, edr_dialog):
         QDialog.__init__(self, parent=edr_dialog)
-        ui_filepath = os.path.join(os.path.dirname(os.path.realpath(__file__)), "ui", "query_area.ui")
-        self.ui = uic.loadUi(ui_filepath, self)
+        self.setupUi(self)
         self.edr_dialog = edr_dialog
         self.map_canvas = self.edr_dialog.plugin.iface.mapCanvas()
         self.output_crs = None
+        self.extent_wkt = None
         self.ok_pb.clicked.connect(self.accept)
         self.setup_data_query_tool()
         self.edr_dialog.hide()
@@ -69,10 +83,9 @@ class AreaQueryBuilderTool(QDialog):
 
     def accept(self):
         current_extent = self.extent_grp.outputExtent()
-        wkt_extent = current_extent.asWktPolygon()
+        self.extent_wkt = current_extent.asWktPolygon()
         self.edr_dialog.current_data_query_tool = self
-        self.edr_dialog.query_extent_le.setText(wkt_extent)
-        self.edr_dialog.query_extent_le.setCursorPosition(0)
+        self.edr_dialog.set_query_extent_text(self.extent_wkt)
         self.edr_dialog.show()
         super().accept()
 
@@ -83,33 +96,28 @@ class AreaQueryBuilderTool(QDialog):
     def setup_data_query_tool(self):
         """Initial data query tool setup."""
         self.extent_grp.setMapCanvas(self.map_canvas)
-        crs_name, crs_wkt = self.edr_dialog.crs_cbo.currentText(), self.edr_dialog.crs_cbo.currentData()
-        if crs_wkt:
-            self.output_crs = QgsCoordinateReferenceSystem.fromWkt(crs_wkt)
-        else:
-            self.output_crs = QgsCoordinateReferenceSystem.fromOgcWmsCrs(crs_name)
+        self.output_crs = self.edr_dialog.current_output_crs()
         self.extent_grp.setOutputCrs(self.output_crs)
         self.extent_grp.setOutputExtentFromCurrent()
 
     def get_query_definition(self):
         """Return query definition object based on user input."""
-        current_extent = self.extent_grp.outputExtent()
-        wkt_extent_polygon = current_extent.asWktPolygon()
+        wkt_extent_polygon = self.extent_wkt
         collection_id, sub_endpoints, query_parameters = self.edr_dialog.collect_query_parameters()
         query_definition = AreaQueryDefinition(collection_id, wkt_extent_polygon, **sub_endpoints, **query_parameters)
         return query_definition
 
 
-class CubeQueryBuilderTool(QDialog):
+class CubeQueryBuilderTool(QDialog, CUBE_FORM_CLASS):
     """Dialog for defining cube data query."""
 
     def __init__(self, edr_dialog):
         QDialog.__init__(self, parent=edr_dialog)
-        ui_filepath = os.path.join(os.path.dirname(os.path.realpath(__file__)), "ui", "query_cube.ui")
-        self.ui = uic.loadUi(ui_filepath, self)
+        self.setupUi(self)
         self.edr_dialog = edr_dialog
         self.map_canvas = self.edr_dialog.plugin.iface.mapCanvas()
         self.output_crs = None
+        self.extent_bbox = None
         self.ok_pb.clicked.connect(self.accept)
         self.setup_data_query_tool()
         self.edr_dialog.hide()
@@ -117,10 +125,9 @@ class CubeQueryBuilderTool(QDialog):
 
     def accept(self):
         current_extent = self.extent_grp.outputExtent()
-        bbox = f"{current_extent.xMinimum()},{current_extent.yMinimum()},{current_extent.xMaximum()},{current_extent.yMaximum()}"
+        self.extent_bbox = f"{current_extent.xMinimum()},{current_extent.yMinimum()},{current_extent.xMaximum()},{current_extent.yMaximum()}"
         self.edr_dialog.current_data_query_tool = self
-        self.edr_dialog.query_extent_le.setText(bbox)
-        self.edr_dialog.query_extent_le.setCursorPosition(0)
+        self.edr_dialog.set_query_extent_text(self.extent_bbox)
         self.edr_dialog.show()
         super().accept()
 
@@ -131,18 +138,13 @@ class CubeQueryBuilderTool(QDialog):
     def setup_data_query_tool(self):
         """Initial data query tool setup."""
         self.extent_grp.setMapCanvas(self.map_canvas)
-        crs_name, crs_wkt = self.edr_dialog.crs_cbo.currentText(), self.edr_dialog.crs_cbo.currentData()
-        if crs_wkt:
-            self.output_crs = QgsCoordinateReferenceSystem.fromWkt(crs_wkt)
-        else:
-            self.output_crs = QgsCoordinateReferenceSystem.fromOgcWmsCrs(crs_name)
+        self.output_crs = self.edr_dialog.current_output_crs()
         self.extent_grp.setOutputCrs(self.output_crs)
         self.extent_grp.setOutputExtentFromCurrent()
 
     def get_query_definition(self):
         """Return query definition object based on user input."""
-        current_extent = self.extent_grp.outputExtent()
-        bbox = f"{current_extent.xMinimum()},{current_extent.yMinimum()},{current_extent.xMaximum()},{current_extent.yMaximum()}"
+        bbox = self.extent_bbox
         collection_id, sub_endpoints, query_parameters = self.edr_dialog.collect_query_parameters()
         query_definition = CubeQueryDefinition(collection_id, bbox, **sub_endpoints, **query_parameters)
         return query_definition
@@ -157,16 +159,14 @@ class PositionQueryBuilderTool(QgsMapToolEmitPoint):
         self.edr_dialog = edr_dialog
         self.output_crs = None
         self.last_position_geometry = None
+        self.last_position_wkt = None
+        self.project_transform = None
         self.setup_data_query_tool()
         self.edr_dialog.hide()
 
     def setup_data_query_tool(self):
         """Initial data query tool setup."""
-        crs_name, crs_wkt = self.edr_dialog.crs_cbo.currentText(), self.edr_dialog.crs_cbo.currentData()
-        if crs_wkt:
-            self.output_crs = QgsCoordinateReferenceSystem.fromWkt(crs_wkt)
-        else:
-            self.output_crs = QgsCoordinateReferenceSystem.fromOgcWmsCrs(crs_name)
+        self.output_crs = self.edr_dialog.current_output_crs()
         self.map_canvas.setMapTool(self)
         self.edr_dialog.current_data_query_tool = self
 
@@ -175,16 +175,17 @@ class PositionQueryBuilderTool(QgsMapToolEmitPoint):
         point = self.toMapCoordinates(e.pos())
         point_geometry = QgsGeometry.fromPointXY(point)
         source_crs = QgsProject.instance().crs()
-        reproject_geometry(point_geometry, source_crs, self.output_crs)
+        self.project_transform = project_coordinate_transform(source_crs, self.output_crs, self.project_transform)
+        reproject_geometry(point_geometry, source_crs, self.output_crs, self.project_transform)
         self.last_position_geometry = point_geometry
-        self.edr_dialog.query_extent_le.setText(self.last_position_geometry.asWkt())
-        self.edr_dialog.query_extent_le.setCursorPosition(0)
+        self.last_position_wkt = point_geometry.asWkt()
+        self.edr_dialog.set_query_extent_text(self.last_position_wkt)
         self.map_canvas.unsetMapTool(self)
         self.edr_dialog.show()
 
     def get_query_definition(self):
         """Return query definition object based on user input."""
-        wkt_position_point = self.last_position_geometry.asWkt()
+        wkt_position_point = self.last_position_wkt
         collection_id, sub_endpoints, query_parameters = self.edr_dialog.collect_query_parameters()
         query_definition = PositionQueryDefinition(
             collection_id, wkt_position_point, **sub_endpoints, **query_parameters
@@ -192,13 +193,12 @@ class PositionQueryBuilderTool(QgsMapToolEmitPoint):
         return query_definition
 
 
-class RadiusQueryBuilderTool(QDialog):
+class RadiusQueryBuilderTool(QDialog, RADIUS_FORM_CLASS):
     """Dialog for defining radius data query."""
 
     def __init__(self, edr_dialog):
         QDialog.__init__(self, parent=edr_dialog)
-        ui_filepath = os.path.join(os.path.dirname(os.path.realpath(__file__)), "ui", "query_radius.ui")
-        self.ui = uic.loadUi(ui_filepath, self)
+        self.setupUi(self)
         self.edr_dialog = edr_dialog
         self.map_canvas = self.edr_dialog.plugin.iface.mapCanvas()
         self.output_crs = None
@@ -207,6 +207,8 @@ class RadiusQueryBuilderTool(QDialog):
         self.radius_center_tool.canvasClicked.connect(self.on_canvas_clicked)
         self.radius_center_point_pb.clicked.connect(self.on_radius_center_point_button_clicked)
         self.last_radius_center_geometry = None
+        self.last_radius_center_wkt = None
+        self.project_transform = None
         self.setup_data_query_tool()
         self.edr_dialog.hide()
         self.show()
@@ -216,12 +218,10 @@ class RadiusQueryBuilderTool(QDialog):
             warn_msg = "Radius centre point is not set. Please select it and try again."
             self.edr_dialog.plugin.communication.show_warn(warn_msg)
             return
-        settings = QgsSettings()
-        settings.setValue(EdrSettingsPath.LAST_RADIUS.value, str(self.radius_spinbox.value()))
-        settings.setValue(EdrSettingsPath.LAST_RADIUS_UNITS.value, self.radius_units_cbo.currentText())
+        SettingsCache.set(EdrSettingsPath.LAST_RADIUS, self.radius_spinbox.value())
+        SettingsCache.set(EdrSettingsPath.LAST_RADIUS_UNITS, self.radius_units_cbo.currentText())
         self.edr_dialog.current_data_query_tool = self
-        self.edr_dialog.query_extent_le.setText(self.last_radius_center_geometry.asWkt())
-        self.edr_dialog.query_extent_le.setCursorPosition(0)
+        self.edr_dialog.set_query_extent_text(self.last_radius_center_wkt)
         self.edr_dialog.show()
         super().accept()
 
@@ -231,17 +231,12 @@ class RadiusQueryBuilderTool(QDialog):
 
     def setup_data_query_tool(self):
         """Initial data query tool setup."""
-        crs_name, crs_wkt = self.edr_dialog.crs_cbo.currentText(), self.edr_dialog.crs_cbo.currentData()
-        if crs_wkt:
-            self.output_crs = QgsCoordinateReferenceSystem.fromWkt(crs_wkt)
-        else:
-            self.output_crs = QgsCoordinateReferenceSystem.fromOgcWmsCrs(crs_name)
+        self.output_crs = self.edr_dialog.current_output_crs()
         radius_query_data = self.edr_dialog.query_cbo.currentData()
         within_units = radius_query_data["link"]["variables"]["within_units"]
         self.radius_units_cbo.addItems(within_units)
-        settings = QgsSettings()
-        last_radius = settings.value(EdrSettingsPath.LAST_RADIUS.value, 10.0, type=float)
-        last_radius_units = settings.value(EdrSettingsPath.LAST_RADIUS_UNITS.value, "")
+        last_radius = SettingsCache.get(EdrSettingsPath.LAST_RADIUS, 10.0, float)
+        last_radius_units = SettingsCache.get(EdrSettingsPath.LAST_RADIUS_UNITS, "")
         self.radius_spinbox.setValue(last_radius)
         self.radius_units_cbo.setCurrentText(last_radius_units)
 
@@ -254,8 +249,10 @@ class RadiusQueryBuilderTool(QDialog):
         """On canvas clicked event."""
         point_geometry = QgsGeometry.fromPointXY(point)
         source_crs = QgsProject.instance().crs()
-        reproject_geometry(point_geometry, source_crs, self.output_crs)
+        self.project_transform = project_coordinate_transform(source_crs, self.output_crs, self.project_transform)
+        reproject_geometry(point_geometry, source_crs, self.output_crs, self.project_transform)
         self.last_radius_center_geometry = point_geometry
+        self.last_radius_center_wkt = point_geometry.asWkt()
         button_label = f"Radius center point: {self.last_radius_center_geometry.asWkt(precision=5)}"
         self.radius_center_point_pb.setText(button_label)
         self.map_canvas.unsetMapTool(self.radius_center_tool)
@@ -264,7 +261,7 @@ class RadiusQueryBuilderTool(QDialog):
     def get_query_definition(self):
         """Return query definition object based on user input."""
         collection_id, sub_endpoints, query_parameters = self.edr_dialog.collect_query_parameters()
-        wkt_radius_center = self.last_radius_center_geometry.asWkt()
+        wkt_radius_center = self.last_radius_center_wkt
         radius_value = self.radius_spinbox.value()
         radius = f"{radius_value:.3f}"
         units = self.radius_units_cbo.currentText()
@@ -301,8 +298,7 @@ class LineStringQueryBuilderTool(QDialog):
             return
         self.edr_dialog.current_data_query_tool = self
         geom = self.get_geometry_from_table()
-        self.edr_dialog.query_extent_le.setText(geom.asWkt().upper())
-        self.edr_dialog.query_extent_le.setCursorPosition(0)
+        self.edr_dialog.set_query_extent_text(geom.asWkt().upper())
         self.disable_main_edr_widgets_based_geometry_type()
         self.edr_dialog.show()
         return super().accept()
@@ -388,9 +384,9 @@ class LineStringQueryBuilderTool(QDialog):
         self.linestring_tw.setRowCount(0)
         self._setup_table()
         if self.selected_geometry:
-            for i, vertex in enumerate(self.selected_geometry.vertices()):
-                self.linestring_tw.insertRow(i)
-
+            vertices = list(self.selected_geometry.vertices())
+            self.linestring_tw.setRowCount(len(vertices))
+            for i, vertex in enumerate(vertices):
                 self.linestring_tw.setCellWidget(i, 0, self._table_item_float(vertex.x()))
                 self.linestring_tw.setCellWidget(i, 1, self._table_item_float(vertex.y()))
 
@@ -404,9 +400,9 @@ class LineStringQueryBuilderTool(QDialog):
                     m_value = int(vertex.m())
                 self.linestring_tw.setCellWidget(i, 3, self._table_item_datetime(m_value))
 
-    def _cell_to_float(self, row: int, col: int) -> typing.Optional[float]:
-        """Convert cell value from TableWidget to float."""
-        cell_widget = self.linestring_tw.cellWidget(row, col)
+    @staticmethod
+    def _cell_widget_to_float(cell_widget: typing.Optional[QLineEdit]) -> typing.Optional[float]:
+        """Convert TableWidget cell widget value to float."""
         if cell_widget is None:
             return None
         text = cell_widget.text()
@@ -416,9 +412,9 @@ class LineStringQueryBuilderTool(QDialog):
             value = QgsDoubleValidator.toDouble(text)
         return value
 
-    def _cell_to_datetime_milisecs(self, row: int, col: int) -> typing.Optional[int]:
-        """Convert cell value from TableWidget to datetime in miliseconds."""
-        cell_widget = self.linestring_tw.cellWidget(row, col)
+    @staticmethod
+    def _cell_widget_to_datetime_milisecs(cell_widget: typing.Optional[QgsDateTimeEdit]) -> typing.Optional[int]:
+        """Convert TableWidget cell widget value to datetime in miliseconds."""
         if cell_widget is None:
             return None
         date_time = cell_widget.dateTime()
@@ -431,15 +427,19 @@ class LineStringQueryBuilderTool(QDialog):
     def get_geometry_from_table(self) -> QgsGeometry:
         """Set geometry to query extent."""
         points: typing.List[QgsPoint] = []
+        cell_widget = self.linestring_tw.cellWidget
+        cell_widget_to_float = self._cell_widget_to_float
+        cell_widget_to_datetime_milisecs = self._cell_widget_to_datetime_milisecs
+        add_z_value, add_m_value = QgsPoint.addZValue, QgsPoint.addMValue
 
         for i in range(self.linestring_tw.rowCount()):
-            point = QgsPoint(self._cell_to_float(i, 0), self._cell_to_float(i, 1))
-            z = self._cell_to_float(i, 2)
+            point = QgsPoint(cell_widget_to_float(cell_widget(i, 0)), cell_widget_to_float(cell_widget(i, 1)))
+            z = cell_widget_to_float(cell_widget(i, 2))
             if z is not None:
-                point.addZValue(z)
-            m = self._cell_to_datetime_milisecs(i, 3)
+                add_z_value(point, z)
+            m = cell_widget_to_datetime_milisecs(cell_widget(i, 3))
             if m is not None:
-                point.addMValue(m)
+                add_m_value(point, m)
             points.append(point)
 
         geom = QgsGeometry.fromPolyline(points)
@@ -474,7 +474,7 @@ class LineStringQueryBuilderTool(QDialog):
     def setup_data_query_tool(self): ...
 
 
-class CorridorQueryBuilderTool(LineStringQueryBuilderTool):
+class CorridorQueryBuilderTool(LineStringQueryBuilderTool, CORRIDOR_FORM_CLASS):
     """Dialog for defining corridor data query."""
 
     height_spinbox: QDoubleSpinBox
@@ -487,8 +487,7 @@ class CorridorQueryBuilderTool(LineStringQueryBuilderTool):
 
     def __init__(self, edr_dialog) -> None:
         super().__init__(parent=edr_dialog)
-        ui_filepath = os.path.join(os.path.dirname(os.path.realpath(__file__)), "ui", "query_corridor.ui")
-        self.ui = uic.loadUi(ui_filepath, self)
+        self.setupUi(self)
         self.edr_dialog = edr_dialog
         self.map_canvas = self.edr_dialog.plugin.iface.mapCanvas()
         self.output_crs = None
@@ -519,11 +518,7 @@ class CorridorQueryBuilderTool(LineStringQueryBuilderTool):
 
     def setup_data_query_tool(self):
         """Initial data query tool setup."""
-        crs_name, crs_wkt = self.edr_dialog.crs_cbo.currentText(), self.edr_dialog.crs_cbo.currentData()
-        if crs_wkt:
-            self.output_crs = QgsCoordinateReferenceSystem.fromWkt(crs_wkt)
-        else:
-            self.output_crs = QgsCoordinateReferenceSystem.fromOgcWmsCrs(crs_name)
+        self.output_crs = self.edr_dialog.current_output_crs()
         corridor_query_data = self.edr_dialog.query_cbo.currentData()
         variables = corridor_query_data["link"]["variables"]
         if "width-units" not in variables:
@@ -571,13 +566,12 @@ class CorridorQueryBuilderTool(LineStringQueryBuilderTool):
         return query_definition
 
 
-class TrajectoryQueryBuilderTool(LineStringQueryBuilderTool):
+class TrajectoryQueryBuilderTool(LineStringQueryBuilderTool, TRAJECTORY_FORM_CLASS):
     """Dialog for defining trajectory data query."""
 
     def __init__(self, edr_dialog):
         super().__init__(parent=edr_dialog)
-        ui_filepath = os.path.join(os.path.dirname(os.path.realpath(__file__)), "ui", "query_trajectory.ui")
-        self.ui = uic.loadUi(ui_filepath, self)
+        self.setupUi(self)
         self.edr_dialog = edr_dialog
         self.map_canvas = self.edr_dialog.plugin.iface.mapCanvas()
         self.output_crs = None
@@ -599,11 +593,7 @@ class TrajectoryQueryBuilderTool(LineStringQueryBuilderTool):
 
     def setup_data_query_tool(self):
         """Initial data query tool setup."""
-        crs_name, crs_wkt = self.edr_dialog.crs_cbo.currentText(), self.edr_dialog.crs_cbo.currentData()
-        if crs_wkt:
-            self.output_crs = QgsCoordinateReferenceSystem.fromWkt(crs_wkt)
-        else:
-            self.output_crs = QgsCoordinateReferenceSystem.fromOgcWmsCrs(crs_name)
+        self.output_crs = self.edr_dialog.current_output_crs()
 
     def get_query_definition(self):
         """Return query definition object based on user input."""
@@ -717,13 +707,12 @@ class LineSelectMapTool(QgsMapToolIdentifyFeature):
             self.rubber_band.reset()
 
 
-class ItemsQueryBuilderTool(QDialog):
+class ItemsQueryBuilderTool(QDialog, ITEMS_FORM_CLASS):
     """Dialog for defining items data query."""
 
     def __init__(self, edr_dialog):
         QDialog.__init__(self, parent=edr_dialog)
-        ui_filepath = os.path.join(os.path.dirname(os.path.realpath(__file__)), "ui", "query_items.ui")
-        self.ui = uic.loadUi(ui_filepath, self)
+        self.setupUi(self)
         self.edr_dialog = edr_dialog
         self.ok_pb.clicked.connect(self.accept)
         self.setup_data_query_tool()
@@ -732,10 +721,9 @@ class ItemsQueryBuilderTool(QDialog):
 
     def accept(self):
         selected_item = self.items_cbo.currentText()
-        QgsSettings().setValue(EdrSettingsPath.LAST_ITEM.value, selected_item)
+        SettingsCache.set(EdrSettingsPath.LAST_ITEM, selected_item)
         self.edr_dialog.current_data_query_tool = self
-        self.edr_dialog.query_extent_le.setText(selected_item)
-        self.edr_dialog.query_extent_le.setCursorPosition(0)
+        self.edr_dialog.set_query_extent_text(selected_item)
         self.edr_dialog.show()
         super().accept()
 
@@ -744,18 +732,34 @@ class ItemsQueryBuilderTool(QDialog):
         super().accept()
 
     def setup_data_query_tool(self):
-        """Initial data query tool setup."""
+        """Initial data query tool setup - collection items are fetched in the background."""
         collection = self.edr_dialog.collection_cbo.currentData()
         collection_id = collection["id"]
         instance_id = self.edr_dialog.instance_cbo.currentText() if self.edr_dialog.instance_cbo.isEnabled() else None
-        try:
-            collection_items = self.edr_dialog.api_client.get_collection_items(collection_id, instance_id)
-        except EdrApiClientError:
-            collection_items = []
-        for collection_item in collection_items:
-            self.items_cbo.addItem(collection_item["id"], collection_item)
-        last_item = QgsSettings().value(EdrSettingsPath.LAST_ITEM.value, "")
+        self.items_cbo.setDisabled(True)
+        self.ok_pb.setDisabled(True)
+        get_collection_items = self.edr_dialog.api_client.snapshot().get_collection_items
+        items_fetcher = EdrCollectionFeaturesFetcher(get_collection_items, collection_id, instance_id)
+        items_fetcher.signals.fetch_success.connect(self.on_items_fetched)
+        items_fetcher.signals.fetch_failure.connect(self.on_items_fetch_failed)
+        self.edr_dialog.plugin.fetcher_pool.start(items_fetcher)
+
+    def on_items_fetched(self, collection_items):
+        """Populate fetched collection items."""
+        add_combobox_items(
+            self.items_cbo,
+            ((collection_item["id"], collection_item) for collection_item in collection_items),
+        )
+        last_item = SettingsCache.get(EdrSettingsPath.LAST_ITEM, "")
         self.items_cbo.setCurrentText(last_item)
+        self.items_cbo.setEnabled(True)
+        self.ok_pb.setEnabled(True)
+
+    def on_items_fetch_failed(self, error_message):
+        """Feedback on fetching collection items failure."""
+        self.edr_dialog.plugin.communication.log_warn(f"Fetching collection items failed: {error_message}")
+        self.items_cbo.setEnabled(True)
+        self.ok_pb.setEnabled(True)
 
     def get_query_definition(self):
         """Return query definition object based on user input."""
@@ -765,13 +769,12 @@ class ItemsQueryBuilderTool(QDialog):
         return query_definition
 
 
-class LocationsQueryBuilderTool(QDialog):
+class LocationsQueryBuilderTool(QDialog, LOCATIONS_FORM_CLASS):
     """Dialog for defining locations data query."""
 
     def __init__(self, edr_dialog):
         QDialog.__init__(self, parent=edr_dialog)
-        ui_filepath = os.path.join(os.path.dirname(os.path.realpath(__file__)), "ui", "query_locations.ui")
-        self.ui = uic.loadUi(ui_filepath, self)
+        self.setupUi(self)
         self.edr_dialog = edr_dialog
         self.ok_pb.clicked.connect(self.accept)
         self.setup_data_query_tool()
@@ -780,10 +783,9 @@ class LocationsQueryBuilderTool(QDialog):
 
     def accept(self):
         selected_location = self.locations_cbo.currentText()
-        QgsSettings().setValue(EdrSettingsPath.LAST_LOCATION.value, selected_location)
+        SettingsCache.set(EdrSettingsPath.LAST_LOCATION, selected_location)
         self.edr_dialog.current_data_query_tool = self
-        self.edr_dialog.query_extent_le.setText(selected_location)
-        self.edr_dialog.query_extent_le.setCursorPosition(0)
+        self.edr_dialog.set_query_extent_text(selected_location)
         self.edr_dialog.show()
         super().accept()
 
@@ -792,18 +794,34 @@ class LocationsQueryBuilderTool(QDialog):
         super().accept()
 
     def setup_data_query_tool(self):
-        """Initial data query tool setup."""
+        """Initial data query tool setup - collection locations are fetched in the background."""
         collection = self.edr_dialog.collection_cbo.currentData()
         collection_id = collection["id"]
         instance_id = self.edr_dialog.instance_cbo.currentText() if self.edr_dialog.instance_cbo.isEnabled() else None
-        try:
-            collection_locations = self.edr_dialog.api_client.get_collection_locations(collection_id, instance_id)
-        except EdrApiClientError:
-            collection_locations = []
-        for collection_location in collection_locations:
-            self.locations_cbo.addItem(collection_location["id"], collection_location)
-        last_location = QgsSettings().value(EdrSettingsPath.LAST_LOCATION.value, "")
+        self.locations_cbo.setDisabled(True)
+        self.ok_pb.setDisabled(True)
+        get_collection_locations = self.edr_dialog.api_client.snapshot().get_collection_locations
+        locations_fetcher = EdrCollectionFeaturesFetcher(get_collection_locations, collection_id, instance_id)
+        locations_fetcher.signals.fetch_success.connect(self.on_locations_fetched)
+        locations_fetcher.signals.fetch_failure.connect(self.on_locations_fetch_failed)
+        self.edr_dialog.plugin.fetcher_pool.start(locations_fetcher)
+
+    def on_locations_fetched(self, collection_locations):
+        """Populate fetched collection locations."""
+        add_combobox_items(
+            self.locations_cbo,
+            ((collection_location["id"], collection_location) for collection_location in collection_locations),
+        )
+        last_location = SettingsCache.get(EdrSettingsPath.LAST_LOCATION, "")
         self.locations_cbo.setCurrentText(last_location)
+        self.locations_cbo.setEnabled(True)
+        self.ok_pb.setEnabled(True)
+
+    def on_locations_fetch_failed(self, error_message):
+        """Feedback on fetching collection locations failure."""
+        self.edr_dialog.plugin.communication.log_warn(f"Fetching collection locations failed: {error_message}")
+        self.locations_cbo.setEnabled(True)
+        self.ok_pb.setEnabled(True)
 
     def get_query_definition(self):
         """Return query definition object based on user input."""
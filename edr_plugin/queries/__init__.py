@@ -5,6 +5,16 @@ from edr_plugin.queries.enumerators import EdrDataQuery
 
 class EDRDataQueryDefinition:
     NAME = None
+    __slots__ = (
+        "collection_id",
+        "instance_id",
+        "output_crs",
+        "output_format",
+        "parameters",
+        "temporal_range",
+        "vertical_extent",
+        "custom_dimension",
+    )
 
     def __init__(
         self,
@@ -97,6 +107,7 @@ class EDRDataQueryDefinition:
 
 class AreaQueryDefinition(EDRDataQueryDefinition):
     NAME = EdrDataQuery.AREA.value
+    __slots__ = ("wkt_polygon",)
 
     def __init__(self, collection_id, wkt_polygon, **sub_endpoints_with_parameters):
         super().__init__(collection_id, **sub_endpoints_with_parameters)
@@ -117,6 +128,7 @@ class AreaQueryDefinition(EDRDataQueryDefinition):
 
 class CubeQueryDefinition(EDRDataQueryDefinition):
     NAME = EdrDataQuery.CUBE.value
+    __slots__ = ("bbox",)
 
     def __init__(self, collection_id, bbox, **sub_endpoints_with_parameters):
         super().__init__(collection_id, **sub_endpoints_with_parameters)
@@ -143,6 +155,7 @@ class CubeQueryDefinition(EDRDataQueryDefinition):
 
 class PositionQueryDefinition(EDRDataQueryDefinition):
     NAME = EdrDataQuery.POSITION.value
+    __slots__ = ("wkt_point",)
 
     def __init__(self, collection_id, wkt_point, **sub_endpoints_with_parameters):
         super().__init__(collection_id, **sub_endpoints_with_parameters)
@@ -163,6 +176,7 @@ class PositionQueryDefinition(EDRDataQueryDefinition):
 
 class RadiusQueryDefinition(EDRDataQueryDefinition):
     NAME = EdrDataQuery.RADIUS.value
+    __slots__ = ("wkt_point", "radius", "units")
 
     def __init__(self, collection_id, wkt_point, radius, units, **sub_endpoints_with_parameters):
         super().__init__(collection_id, **sub_endpoints_with_parameters)
@@ -189,6 +203,7 @@ class RadiusQueryDefinition(EDRDataQueryDefinition):
 
 class ItemsQueryDefinition(EDRDataQueryDefinition):
     NAME = EdrDataQuery.ITEMS.value
+    __slots__ = ("item_id",)
 
     def __init__(self, collection_id, item_id, **sub_endpoints_with_parameters):
         super().__init__(collection_id, **sub_endpoints_with_parameters)
@@ -209,6 +224,7 @@ class ItemsQueryDefinition(EDRDataQueryDefinition):
 
 class LocationsQueryDefinition(EDRDataQueryDefinition):
     NAME = EdrDataQuery.LOCATIONS.value
+    __slots__ = ("location_id",)
 
     def __init__(self, collection_id, location_id, **sub_endpoints_with_parameters):
         super().__init__(collection_id, **sub_endpoints_with_parameters)
@@ -229,6 +245,7 @@ class LocationsQueryDefinition(EDRDataQueryDefinition):
 
 class TrajectoryQueryDefinition(EDRDataQueryDefinition):
     NAME = EdrDataQuery.TRAJECTORY.value
+    __slots__ = ("wkt_trajectory",)
 
     def __init__(self, collection_id, wkt_trajectory, **sub_endpoints_with_parameters):
         super().__init__(collection_id, **sub_endpoints_with_parameters)
@@ -249,6 +266,16 @@ class TrajectoryQueryDefinition(EDRDataQueryDefinition):
 
 class CorridorQueryDefinition(EDRDataQueryDefinition):
     NAME = EdrDataQuery.CORRIDOR.value
+    __slots__ = (
+        "wkt_corridor",
+        "width",
+        "width_units",
+        "height",
+        "height_units",
+        "resolution_x",
+        "resolution_y",
+        "resolution_z",
+    )
 
     def __init__(
         self,
@@ -1,4 +1,4 @@
-from qgis.PyQt.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
+from qgis.PyQt.QtCore import QCoreApplication, QObject, QRunnable, pyqtSignal, pyqtSlot
 
 from edr_plugin.api_client import EdrApiClientError
 from edr_plugin.utils import download_reply_file
@@ -50,3 +50,162 @@ class EdrDataDownloader(QRunnable):
     def report_error(self, error_message):
         """Report runnable error message."""
         self.signals.download_failure.emit(error_message, self.download_filepath)
+
+
+class EdrCollectionMetadataFetcherSignals(QObject):
+    """EDR collection metadata fetcher signals."""
+
+    fetch_success = pyqtSignal(object, object)
+    fetch_failure = pyqtSignal(str)
+
+
+class EdrCollectionMetadataFetcher(QRunnable):
+    """Runnable class for fetching EDR collection and its instances within separate thread."""
+
+    def __init__(self, api_client, collection_id):
+        super().__init__()
+        self.api_client = api_client
+        self.collection_id = collection_id
+        self.signals = EdrCollectionMetadataFetcherSignals()
+
+    @pyqtSlot()
+    def run(self):
+        """Run fetch task."""
+        try:
+            collection = self.api_client.get_collection(self.collection_id)
+        except Exception as err:
+            self.report_error(f"Fetching collection failed due to the following error:\n{err}")
+            return
+        try:
+            instances = self.api_client.get_collection_instances(self.collection_id)
+        except EdrApiClientError:
+            instances = []
+        except Exception as err:
+            self.report_error(f"Fetching collection instances failed due to the following error:\n{err}")
+            return
+        self.report_success(collection, instances)
+
+    def report_success(self, collection, instances):
+        """Report fetched collection and its instances."""
+        self.signals.fetch_success.emit(collection, instances)
+
+    def report_error(self, error_message):
+        """Report runnable error message."""
+        self.signals.fetch_failure.emit(error_message)
+
+
+class EdrCollectionsFetcherSignals(QObject):
+    """EDR collections fetcher signals."""
+
+    fetch_success = pyqtSignal(int, object)
+    fetch_failure = pyqtSignal(int, str)
+
+
+class EdrCollectionsFetcher(QRunnable):
+    """Runnable class for fetching EDR server collections within separate thread."""
+
+    def __init__(self, api_client, request_id):
+        super().__init__()
+        self.api_client = api_client
+        self.request_id = request_id
+        self.signals = EdrCollectionsFetcherSignals()
+
+    @pyqtSlot()
+    def run(self):
+        """Run fetch task."""
+        try:
+            collections = self.api_client.get_collections()
+            self.signals.fetch_success.emit(self.request_id, collections)
+        except Exception as err:
+            self.signals.fetch_failure.emit(self.request_id, str(err))
+
+
+class EdrCollectionInstancesFetcherSignals(QObject):
+    """EDR collection instances fetcher signals."""
+
+    fetch_success = pyqtSignal(int, object)
+    fetch_failure = pyqtSignal(int, str)
+
+
+class EdrCollectionInstancesFetcher(QRunnable):
+    """Runnable class for fetching EDR collection instances within separate thread."""
+
+    def __init__(self, api_client, collection_id, request_id):
+        super().__init__()
+        self.api_client = api_client
+        self.collection_id = collection_id
+        self.request_id = request_id
+        self.signals = EdrCollectionInstancesFetcherSignals()
+
+    @pyqtSlot()
+    def run(self):
+        """Run fetch task."""
+        try:
+            instances = self.api_client.get_collection_instances(self.collection_id)
+            self.signals.fetch_success.emit(self.request_id, instances)
+        except Exception as err:
+            self.signals.fetch_failure.emit(self.request_id, str(err))
+
+
+class EdrCollectionFeaturesFetcherSignals(QObject):
+    """EDR collection features fetcher signals."""
+
+    fetch_success = pyqtSignal(object)
+    fetch_failure = pyqtSignal(str)
+
+
+class EdrCollectionFeaturesFetcher(QRunnable):
+    """Runnable class for fetching EDR collection items or locations within separate thread."""
+
+    def __init__(self, features_getter, collection_id, instance_id=None):
+        super().__init__()
+        self.features_getter = features_getter
+        self.collection_id = collection_id
+        self.instance_id = instance_id
+        self.signals = EdrCollectionFeaturesFetcherSignals()
+
+    @pyqtSlot()
+    def run(self):
+        """Run fetch task."""
+        try:
+            features = self.features_getter(self.collection_id, self.instance_id)
+            self.signals.fetch_success.emit(features)
+        except Exception as err:
+            self.signals.fetch_failure.emit(str(err))
+
+
+class EdrLayerLoaderSignals(QObject):
+    """EDR layer loader signals."""
+
+    load_success = pyqtSignal(object)
+    load_failure = pyqtSignal(str)
+
+
+class EdrLayerLoader(QRunnable):
+    """Runnable class for creating map layer from the file within separate thread."""
+
+    def __init__(self, layer_factory, filepath, layer_name):
+        super().__init__()
+        self.layer_factory = layer_factory
+        self.filepath = filepath
+        self.layer_name = layer_name
+        self.signals = EdrLayerLoaderSignals()
+
+    @pyqtSlot()
+    def run(self):
+        """Run layer loading task."""
+        try:
+            layer = self.layer_factory(self.filepath, self.layer_name)
+            layer.moveToThread(QCoreApplication.instance().thread())
+            self.report_success(layer)
+        except Exception as err:
+            error_msg = f"Loading of '{self.filepath}' failed due to the following exception: {err}"
+            self.report_error(error_msg)
+
+    def report_success(self, layer):
+        """Report runnable finished with the created layer."""
+        self.signals.load_success.emit(layer)
+
+    def report_error(self, error_message):
+        """Report runnable error message."""
+        self.signals.load_failure.emit(error_message)
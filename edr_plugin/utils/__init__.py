@@ -1,19 +1,33 @@
+import json
 import os
 import typing
+from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from types import MappingProxyType
 from uuid import uuid4
 
 from qgis.core import (
     QgsContrastEnhancement,
+    QgsCoordinateReferenceSystem,
     QgsCoordinateTransform,
     QgsLayerTreeGroup,
     QgsLayerTreeLayer,
     QgsProject,
     QgsRasterBandStats,
     QgsRasterLayer,
+    QgsSettings,
     QgsSingleBandGrayRenderer,
 )
+from qgis.PyQt.QtCore import QDateTime, Qt
+from qgis.PyQt.QtGui import QIcon
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ICONS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "icons")
 
 CONTENT_TYPE_EXTENSIONS = MappingProxyType(
     {
@@ -121,20 +135,91 @@ def reproject_geometry(geometry, src_crs, dst_crs, transformation=None):
     if src_crs == dst_crs:
         return geometry
     if transformation is None:
-        project = QgsProject.instance()
-        transform_context = project.transformContext()
-        transformation = QgsCoordinateTransform(src_crs, dst_crs, transform_context)
+        transformation = project_coordinate_transform(src_crs, dst_crs)
     geometry.transform(transformation)
     return geometry
 
 
+def project_coordinate_transform(src_crs, dst_crs, transformation=None):
+    """Return coordinate transform within the project transform context, reuse the given one if it still applies."""
+    if transformation is not None:
+        if transformation.sourceCrs() == src_crs and transformation.destinationCrs() == dst_crs:
+            return transformation
+    transform_context = QgsProject.instance().transformContext()
+    transformation = QgsCoordinateTransform(src_crs, dst_crs, transform_context)
+    return transformation
+
+
+def add_combobox_items(combobox, items_with_data):
+    """Add items with associated user data to the combobox in a single batch with the combobox signals blocked."""
+    item_texts, item_data = [], []
+    for item_text, data in items_with_data:
+        item_texts.append(item_text)
+        item_data.append(data)
+    signals_blocked = combobox.blockSignals(True)
+    combobox.setUpdatesEnabled(False)
+    try:
+        first_item_index = combobox.count()
+        combobox.addItems(item_texts)
+        for item_index, data in enumerate(item_data, first_item_index):
+            combobox.setItemData(item_index, data)
+    finally:
+        combobox.setUpdatesEnabled(True)
+        combobox.blockSignals(signals_blocked)
+
+
+@lru_cache(maxsize=256)
+def ogc_crs_wkt(crs_name):
+    """Return WKT definition of the CRS with the given OGC name."""
+    crs = QgsCoordinateReferenceSystem.fromOgcWmsCrs(crs_name)
+    return crs.toWkt()
+
+
+@lru_cache(maxsize=256)
+def _cached_crs(crs_name, crs_wkt):
+    if crs_wkt:
+        crs = QgsCoordinateReferenceSystem.fromWkt(crs_wkt)
+    else:
+        crs = QgsCoordinateReferenceSystem.fromOgcWmsCrs(crs_name)
+    return crs
+
+
+def crs_from_definition(crs_name, crs_wkt=None):
+    """Return CRS created from the WKT definition if available, otherwise from the OGC name."""
+    crs = QgsCoordinateReferenceSystem(_cached_crs(crs_name, crs_wkt))
+    return crs
+
+
+@lru_cache(maxsize=1024)
+def _iso_datetime_msecs(datetime_str):
+    try:
+        parsed_datetime = datetime.fromisoformat(datetime_str.replace("Z", "+00:00"))
+        return round(parsed_datetime.timestamp() * 1000)
+    except (AttributeError, OverflowError, OSError, ValueError):
+        return None
+
+
+def qdatetime_from_iso(datetime_str):
+    """Return QDateTime parsed from the ISO 8601 string, falling back to the Qt parser for unsupported formats."""
+    msecs = _iso_datetime_msecs(datetime_str)
+    if msecs is None:
+        return QDateTime.fromString(datetime_str, Qt.ISODate)
+    return QDateTime.fromMSecsSinceEpoch(msecs, Qt.UTC)
+
+
 def icon_filepath(icon_filename):
     """Return icon filepath."""
-    plugin_dirname = os.path.dirname(os.path.dirname(__file__))
-    filepath = os.path.join(plugin_dirname, "icons", icon_filename)
+    filepath = os.path.join(ICONS_DIR, icon_filename)
     return filepath
 
 
+@lru_cache(maxsize=None)
+def plugin_icon(icon_filename):
+    """Return plugin icon - it is loaded from the file once and shared afterwards."""
+    icon = QIcon(icon_filepath(icon_filename))
+    return icon
+
+
 class EdrSettingsPath(Enum):
     """Enumerator with EDR settings paths."""
 
@@ -149,6 +234,79 @@ class EdrSettingsPath(Enum):
     LAST_LOCATION = "edr_plugin/last_location"
 
 
+def json_loads(raw_json: str):
+    """Deserialize JSON string, using orjson if it is available."""
+    if orjson is not None:
+        return orjson.loads(raw_json)
+    return json.loads(raw_json)
+
+
+def json_dumps(obj) -> str:
+    """Serialize object to the JSON string, using orjson if it is available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+class SettingsCache:
+    """In-memory cache of the EDR settings values with write-through to the QGIS settings."""
+
+    _values = {}
+    _saved_queries_state = None  # Raw saved queries JSON with its parsed content, never modified in place
+
+    @staticmethod
+    def settings() -> QgsSettings:
+        """Return new QGIS settings instance - QSettings objects can't be shared between threads."""
+        return QgsSettings()
+
+    @classmethod
+    def get(cls, settings_path: EdrSettingsPath, default=None, value_type=None):
+        """Return settings value, read it from the QGIS settings only on the first access."""
+        key = settings_path.value
+        try:
+            return cls._values[key]
+        except KeyError:
+            settings = cls.settings()
+            if value_type is None:
+                value = settings.value(key, default)
+            else:
+                value = settings.value(key, default, type=value_type)
+            cls._values[key] = value
+            return value
+
+    @classmethod
+    def set(cls, settings_path: EdrSettingsPath, value):
+        """Set settings value, write it into the QGIS settings only if it was changed."""
+        key = settings_path.value
+        if key in cls._values and cls._values[key] == value:
+            return
+        cls._values[key] = value
+        cls.settings().setValue(key, value)
+
+    @staticmethod
+    def _copy_saved_queries(saved_queries: typing.Dict) -> typing.Dict:
+        """Return copy of the saved queries which can be modified without affecting the source."""
+        return {server_url: dict(server_queries) for server_url, server_queries in saved_queries.items()}
+
+    @classmethod
+    def saved_queries(cls, reload: bool = False) -> typing.Dict:
+        """Return copy of the saved queries - settings are read on the first access or on reload only."""
+        saved_queries_state = cls._saved_queries_state
+        if saved_queries_state is None or reload:
+            raw_saved_queries = cls.settings().value(EdrSettingsPath.SAVED_QUERIES.value, "{}")
+            if saved_queries_state is None or raw_saved_queries != saved_queries_state[0]:
+                saved_queries_state = (raw_saved_queries, json_loads(raw_saved_queries))
+                cls._saved_queries_state = saved_queries_state
+        return cls._copy_saved_queries(saved_queries_state[1])
+
+    @classmethod
+    def save_saved_queries(cls, saved_queries: typing.Dict):
+        """Save saved queries into the QGIS settings."""
+        raw_saved_queries = json_dumps(saved_queries)
+        cls._saved_queries_state = (raw_saved_queries, cls._copy_saved_queries(saved_queries))
+        cls.settings().setValue(EdrSettingsPath.SAVED_QUERIES.value, raw_saved_queries)
+
+
 def string_to_bool(value: typing.Union[str, bool]) -> bool:
     """Convert value to boolean."""
     if isinstance(value, bool):
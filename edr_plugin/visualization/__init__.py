@@ -1,9 +1,11 @@
 import os
+from functools import partial
 
 from qgis.core import QgsMeshLayer, QgsProject, QgsRasterLayer, QgsVectorLayer
 from qgis.utils import iface
 
 from edr_plugin.coveragejson.coverage_json_reader import CoverageJSONReader
+from edr_plugin.threading import EdrLayerLoader
 from edr_plugin.utils import add_to_layer_group, single_band_gray_renderer, spawn_layer_group
 
 
@@ -27,19 +29,31 @@ class EdrLayerManager:
                 add_to_layer_group(self.project, group, layer)
                 self.loaded_layers[layer.id()] = layer
 
-    def ogr_layer_loader(self, filepath, layer_name):
+    @staticmethod
+    def create_ogr_layer(filepath, layer_name):
         layer = QgsVectorLayer(filepath, layer_name, "ogr")
-        self.add_layers(layer)
+        return layer
 
-    def gdal_layer_loader(self, filepath, layer_name):
+    @staticmethod
+    def create_gdal_layer(filepath, layer_name):
         layer = QgsRasterLayer(filepath, layer_name, "gdal")
-        single_band_gray_renderer(layer)
-        self.add_layers(layer)
+        return layer
 
-    def mdal_layer_loader(self, filepath, layer_name):
+    @staticmethod
+    def create_mdal_layer(filepath, layer_name):
         layer = QgsMeshLayer(filepath, layer_name, "mdal")
+        return layer
+
+    def add_file_layer(self, layer):
+        # Raster renderer setup calculates band statistics, so it is done here within the main thread
+        if isinstance(layer, QgsRasterLayer):
+            single_band_gray_renderer(layer)
         self.add_layers(layer)
 
+    def file_layer_loader(self, layer_factory, filepath, layer_name):
+        layer = layer_factory(filepath, layer_name)
+        self.add_file_layer(layer)
+
     def covjson_layer_loader(self, filepath, layer_name):
         try:
             self.plugin.communication.progress_bar(f"Parsing '{filepath}' CoverageJSON ...", clear_msg_bar=True)
@@ -62,20 +76,28 @@ class EdrLayerManager:
         self.add_layers(*layers, group=layers_group)
         covjson_reader.qgsproject_setup_time_settings()
 
+    @property
+    def file_extension_layer_factories(self):
+        extension_to_factory_map = {
+            ".geojson": self.create_ogr_layer,
+            ".gpkg": self.create_ogr_layer,
+            ".grib2": self.create_mdal_layer,
+            ".json": self.create_ogr_layer,
+            ".kml": self.create_ogr_layer,
+            ".nc": self.create_mdal_layer,
+            ".tif": self.create_gdal_layer,
+            ".tiff": self.create_gdal_layer,
+            ".geotiff": self.create_gdal_layer,
+        }
+        return extension_to_factory_map
+
     @property
     def file_extension_layer_loaders(self):
         extension_to_loader_map = {
-            ".covjson": self.covjson_layer_loader,
-            ".geojson": self.ogr_layer_loader,
-            ".gpkg": self.ogr_layer_loader,
-            ".grib2": self.mdal_layer_loader,
-            ".json": self.ogr_layer_loader,
-            ".kml": self.ogr_layer_loader,
-            ".nc": self.mdal_layer_loader,
-            ".tif": self.gdal_layer_loader,
-            ".tiff": self.gdal_layer_loader,
-            ".geotiff": self.gdal_layer_loader,
+            file_extension: partial(self.file_layer_loader, layer_factory)
+            for file_extension, layer_factory in self.file_extension_layer_factories.items()
         }
+        extension_to_loader_map[".covjson"] = self.covjson_layer_loader
         return extension_to_loader_map
 
     def add_layer_from_file(self, filepath, layer_name=None):
@@ -96,3 +118,18 @@ class EdrLayerManager:
             self.plugin.communication.bar_warn(f"Loading of '{filepath}' failed due to the following exception: {e}")
             return False
         return True
+
+    def add_layer_from_file_in_background(self, filepath, layer_name=None):
+        # CoverageJSON loading may ask the user for a confirmation, so it stays within the main thread
+        file_extension = os.path.splitext(filepath)[1].lower()
+        try:
+            layer_factory = self.file_extension_layer_factories[file_extension]
+        except KeyError:
+            return self.add_layer_from_file(filepath, layer_name)
+        if layer_name is None:
+            layer_name = os.path.basename(filepath)
+        layer_loader = EdrLayerLoader(layer_factory, filepath, layer_name)
+        layer_loader.signals.load_success.connect(self.add_file_layer)
+        layer_loader.signals.load_failure.connect(self.plugin.communication.bar_warn)
+        self.plugin.fetcher_pool.start(layer_loader)
+        return True
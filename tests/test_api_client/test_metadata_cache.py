@@ -0,0 +1,105 @@
+import pytest
+
+import edr_plugin.api_client as api_client_module
+from edr_plugin.api_client import METADATA_CACHE, METADATA_CACHE_TTL, EdrApiClient
+
+
+class FakeContent:
+    def __init__(self, raw_content: bytes):
+        self.raw_content = raw_content
+
+    def data(self) -> bytes:
+        return self.raw_content
+
+
+class FakeReply:
+    def __init__(self, raw_content: bytes):
+        self.raw_content = raw_content
+
+    def content(self) -> FakeContent:
+        return FakeContent(self.raw_content)
+
+
+@pytest.fixture
+def requested_urls(monkeypatch) -> list:
+    requested = []
+
+    def get_request_reply(client, url, *args, **kwargs):
+        requested.append((url, client.authentication_config_id))
+        return FakeReply(f'{{"url": "{url}", "authcfg": "{client.authentication_config_id}"}}'.encode())
+
+    EdrApiClient.clear_metadata_cache()
+    monkeypatch.setattr(EdrApiClient, "get_request_reply", get_request_reply)
+    yield requested
+    EdrApiClient.clear_metadata_cache()
+
+
+@pytest.fixture
+def clock(monkeypatch) -> list:
+    current_time = [1000.0]
+    monkeypatch.setattr(api_client_module.time, "monotonic", lambda: current_time[0])
+    return current_time
+
+
+def test_cached_within_ttl(requested_urls, clock):
+    client = EdrApiClient("https://example.com/edr")
+
+    first = client.get_cached_metadata("https://example.com/edr/collections")
+    clock[0] += METADATA_CACHE_TTL - 1
+    second = client.get_cached_metadata("https://example.com/edr/collections")
+
+    assert first == second
+    assert len(requested_urls) == 1
+
+
+def test_expired_entry_refetched(requested_urls, clock):
+    client = EdrApiClient("https://example.com/edr")
+
+    client.get_cached_metadata("https://example.com/edr/collections")
+    clock[0] += METADATA_CACHE_TTL
+    client.get_cached_metadata("https://example.com/edr/collections")
+
+    assert len(requested_urls) == 2
+    assert len(METADATA_CACHE) == 1
+    fetch_time, _ = METADATA_CACHE[("https://example.com/edr/collections", None)]
+    assert fetch_time == clock[0]
+
+
+def test_keyed_by_authentication_config(requested_urls, clock):
+    url = "https://example.com/edr/collections"
+    anonymous_client = EdrApiClient("https://example.com/edr")
+    authenticated_client = EdrApiClient("https://example.com/edr", authentication_config_id="abc1234")
+
+    anonymous_metadata = anonymous_client.get_cached_metadata(url)
+    authenticated_metadata = authenticated_client.get_cached_metadata(url)
+    authenticated_client.get_cached_metadata(url)
+
+    assert requested_urls == [(url, None), (url, "abc1234")]
+    assert anonymous_metadata["authcfg"] == "None"
+    assert authenticated_metadata["authcfg"] == "abc1234"
+
+
+def test_least_recently_used_evicted(requested_urls, clock, monkeypatch):
+    monkeypatch.setattr(api_client_module, "METADATA_CACHE_MAX_ENTRIES", 2)
+    client = EdrApiClient("https://example.com/edr")
+
+    client.get_cached_metadata("https://example.com/edr/collections/a")
+    client.get_cached_metadata("https://example.com/edr/collections/b")
+    client.get_cached_metadata("https://example.com/edr/collections/a")
+    client.get_cached_metadata("https://example.com/edr/collections/c")
+
+    assert list(METADATA_CACHE) == [
+        ("https://example.com/edr/collections/a", None),
+        ("https://example.com/edr/collections/c", None),
+    ]
+
+
+def test_large_content_not_cached(requested_urls, clock, monkeypatch):
+    monkeypatch.setattr(api_client_module, "METADATA_CACHE_MAX_CONTENT_SIZE", 10)
+    client = EdrApiClient("https://example.com/edr")
+
+    client.get_cached_metadata("https://example.com/edr/collections/a/items")
+    client.get_cached_metadata("https://example.com/edr/collections/a/items")
+
+    assert len(requested_urls) == 2
+    assert len(METADATA_CACHE) == 0
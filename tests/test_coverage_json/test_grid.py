@@ -2,12 +2,13 @@ import typing
 
 import numpy as np
 import pytest
+from osgeo import gdal
 from qgis.core import QgsMapLayer, QgsRasterLayer
 from qgis.PyQt.QtCore import QDateTime
 
 from edr_plugin.coveragejson.coverage import Coverage
 from edr_plugin.coveragejson.coverage_json_reader import CoverageJSONReader
-from edr_plugin.coveragejson.utils import ArrayWithTZ
+from edr_plugin.coveragejson.utils import ArrayWithTZ, RasterTemplate
 
 
 def test_simple_grid(data_dir):
@@ -235,3 +236,22 @@ def test_grid_empty_layer(data_dir):
     assert len(layers) == 55
     for layer in layers:
         assert isinstance(layer, QgsMapLayer)
+
+
+def test_write_empty_array_to_band(tmp_path):
+    raster_template = RasterTemplate([0.0, 1.0, 2.0], [0.0, 1.0], gdal.GDT_Float32, "")
+    dp = raster_template.save_empty_raster(tmp_path / "empty.tif")
+
+    with pytest.raises(ValueError):
+        RasterTemplate.write_array_to_band(dp, np.array([]))
+
+
+def test_write_no_data_array_to_band(tmp_path):
+    raster_template = RasterTemplate([0.0, 1.0, 2.0], [0.0, 1.0], gdal.GDT_Float32, "")
+    dp = raster_template.save_empty_raster(tmp_path / "no_data.tif")
+
+    RasterTemplate.write_array_to_band(dp, np.full((2, 3), None, dtype=object), no_data_value=-9999)
+
+    band = dp.GetRasterBand(1)
+    assert band.GetNoDataValue() == -9999
+    assert (band.ReadAsArray() == -9999).all()
@@ -0,0 +1,37 @@
+from qgis.PyQt.QtCore import QDate, QDateTime, Qt, QTime
+
+from edr_plugin.utils import qdatetime_from_iso
+
+
+def test_utc_z_suffix():
+    parsed = qdatetime_from_iso("2022-07-12T16:00:00Z")
+
+    assert parsed.isValid()
+    assert parsed == QDateTime(QDate(2022, 7, 12), QTime(16, 0), Qt.UTC)
+
+
+def test_explicit_offset():
+    parsed = qdatetime_from_iso("2022-07-12T18:30:00+02:30")
+
+    assert parsed.isValid()
+    assert parsed == QDateTime(QDate(2022, 7, 12), QTime(16, 0), Qt.UTC)
+
+
+def test_naive_local_time():
+    parsed = qdatetime_from_iso("2022-07-12T16:00:00")
+
+    assert parsed.isValid()
+    assert parsed == QDateTime(QDate(2022, 7, 12), QTime(16, 0), Qt.LocalTime)
+
+
+def test_fractional_seconds():
+    parsed = qdatetime_from_iso("2022-07-12T16:00:00.250Z")
+
+    assert parsed.isValid()
+    assert parsed == QDateTime(QDate(2022, 7, 12), QTime(16, 0, 0, 250), Qt.UTC)
+
+
+def test_unparsable_falls_back_to_qt_parser():
+    parsed = qdatetime_from_iso("not a datetime")
+
+    assert not parsed.isValid()